@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Shared connection and timeline lookup helpers for the dev/ test scripts."""
+
+from typing import NamedTuple
+
+
+class ResolveContext(NamedTuple):
+    resolve: object
+    pm: object
+    proj: object
+    mp: object
+    root: object
+
+
+_TIMELINE_INDEX = {}
+_CLIP_TIMELINE = {}
+
+
+def connect():
+    """Connect to Resolve once and return the handles every test script needs."""
+    import DaVinciResolveScript as dvr
+
+    resolve = dvr.scriptapp("Resolve")
+    pm = resolve.GetProjectManager()
+    proj = pm.GetCurrentProject()
+    mp = proj.GetMediaPool()
+    return ResolveContext(resolve, pm, proj, mp, mp.GetRootFolder())
+
+
+def _project_key(proj):
+    return proj.GetUniqueId() or id(proj)
+
+
+def list_timelines(proj):
+    """Fetch every timeline handle in ``proj`` once, skipping empty slots."""
+    count = int(proj.GetTimelineCount() or 0)
+    return [tl for tl in (proj.GetTimelineByIndex(i) for i in range(1, count + 1)) if tl]
+
+
+def iter_timelines(proj, keep=None):
+    """Yield ``(tl, name, name_lower, markers)`` for each timeline in one walk.
+
+    ``keep(name_lower)`` filters before markers are fetched, so skipped timelines
+    cost no GetMarkers round-trip.
+    """
+    for tl in list_timelines(proj):
+        name = tl.GetName() or ""
+        name_lower = name.lower()
+        if keep is None or keep(name_lower):
+            yield tl, name, name_lower, tl.GetMarkers() or {}
+
+
+def get_timeline_index(proj):
+    """Return a cached ``{name: timeline}`` map for ``proj`` (built once per project)."""
+    key = _project_key(proj)
+    index = _TIMELINE_INDEX.get(key)
+    if index is None:
+        index = {tl.GetName(): tl for tl in list_timelines(proj)}
+        _TIMELINE_INDEX[key] = index
+    return index
+
+
+def invalidate_timeline_index(proj):
+    """Drop the cached index for ``proj`` so the next lookup rescans."""
+    _TIMELINE_INDEX.pop(_project_key(proj), None)
+
+
+def find_or_create_timeline(mp, proj, name, fresh=False, folder=None):
+    """Return the timeline called ``name``, creating it if missing.
+
+    With ``fresh=True`` an existing timeline is deleted first so the caller
+    always gets a newly created, empty timeline.
+    """
+    index = get_timeline_index(proj)
+    tl = index.get(name)
+    if tl and not fresh:
+        return tl
+    if tl:
+        mp.DeleteTimelines([tl])
+        index.pop(name, None)
+
+    mp.SetCurrentFolder(folder or mp.GetRootFolder())
+    tl = mp.CreateEmptyTimeline(name)
+    if tl:
+        index[name] = tl
+    return tl
+
+
+def has_clips(tl):
+    """True if any audio/video track on ``tl`` holds an item (stops at the first hit)."""
+    return any(
+        tl.GetItemListInTrack(kind, idx)
+        for kind in ("audio", "video")
+        for idx in range(1, (tl.GetTrackCount(kind) or 0) + 1)
+    )
+
+
+def first_timeline_with_clips(proj):
+    """Return the first timeline in ``proj`` that has clips, or None.
+
+    The answer is remembered per project for the life of the process, so
+    several tests run from one driver only scan once.
+    """
+    key = _project_key(proj)
+    if key not in _CLIP_TIMELINE:
+        # Probed sequentially: the scripting bridge shares a single connection and
+        # is not documented as safe for concurrent calls.
+        _CLIP_TIMELINE[key] = next((t for t in list_timelines(proj) if has_clips(t)), None)
+    return _CLIP_TIMELINE[key]
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Run the with-clip marker tests against one shared Resolve connection.
+
+Usage: run_clip_tests.py [with_clip] [with_clips]   (default: both)
+"""
+
+import sys
+
+import test_with_clip
+import test_with_clips
+from resolve_utils import connect
+
+TESTS = {
+    "with_clip": test_with_clip.run,
+    "with_clips": test_with_clips.run,
+}
+
+names = sys.argv[1:] or list(TESTS)
+unknown = [n for n in names if n not in TESTS]
+if unknown:
+    print(f"❌ Unknown test(s): {', '.join(unknown)} (choose from {', '.join(TESTS)})")
+    sys.exit(1)
+
+ctx = connect()
+for name in names:
+    print(f"\n{'=' * 60}\n▶ {name}\n{'=' * 60}")
+    TESTS[name](ctx)
@@ -60,7 +60,7 @@ except Exception as e:
 print("\n3️⃣  Checking title matcher flexibility...")
 has_flexible_match = False
 try:
-    if content and 'if ("shotfx" in t) or ("shot fx" in t):' in content:
+    if content and '(("shotfx", "shot fx"), _shotfx_pack)' in content:
         print("   ✅ Flexible 'contains' matching implemented")
         has_flexible_match = True
     elif content and 'if t.startswith("shotfx -"):' in content:
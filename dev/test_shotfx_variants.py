@@ -61,7 +61,7 @@ for title in shotfx_timelines:
         # Show first few variant markers
         print(f"   Sample tips:")
         for i, m in enumerate(markers[4:7], 1):  # Show 3 variant tips
-            name = m.get("name", "")
+            name = m.name
             print(f"      {i}. {name}")
     else:
         print(f"   📌 Base ShotFX principles only")
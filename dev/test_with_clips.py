@@ -1,61 +1,38 @@
 #!/usr/bin/env python3
-"""Test with a delay after adding clip."""
+"""Test adding a marker to an existing timeline that already has clips."""
 
-import DaVinciResolveScript as dvr
-import time
+from resolve_utils import connect, first_timeline_with_clips
 
-resolve = dvr.scriptapp("Resolve")
-pm = resolve.GetProjectManager()
-proj = pm.GetCurrentProject()
 
-# Use an existing timeline that has a clip
-print("🔍 Looking for a timeline with clips...\n")
+def run(ctx):
+    proj = ctx.proj
 
-for i in range(1, int(proj.GetTimelineCount()) + 1):
-    tl = proj.GetTimelineByIndex(i)
+    # Use an existing timeline that has a clip
+    print("🔍 Looking for a timeline with clips...\n")
+
+    tl = first_timeline_with_clips(proj)
     if not tl:
-        continue
-
-    name = tl.GetName()
-
-    # Check if it has clips
-    audio_tracks = tl.GetTrackCount("audio")
-    has_clips = False
-
-    for idx in range(1, audio_tracks + 1):
-        items = tl.GetItemListInTrack("audio", idx)
-        if items and len(items) > 0:
-            has_clips = True
-            break
-
-    if not has_clips:
-        video_tracks = tl.GetTrackCount("video")
-        for idx in range(1, video_tracks + 1):
-            items = tl.GetItemListInTrack("video", idx)
-            if items and len(items) > 0:
-                has_clips = True
-                break
-
-    if has_clips:
-        print(f"✅ Found timeline with clips: {name}")
-
-        # Check current markers
-        markers = tl.GetMarkers()
-        marker_count = len(markers) if markers else 0
-        print(f"  Current markers: {marker_count}\n")
-
-        # Try adding a new marker
-        print("🏷️ Trying to add marker @ frame 100...")
-        success = tl.AddMarker(100, "Cocoa", "Test API Marker", "Testing on timeline with clips", 0)
-
-        if success:
-            print("  ✅ SUCCESS! Marker added to timeline with clips!")
-        else:
-            print("  ❌ Failed even on timeline with clips")
-
-        # Check final count
-        markers = tl.GetMarkers()
-        new_count = len(markers) if markers else 0
-        print(f"  Final markers: {new_count}")
-
-        break
+        return
+
+    print(f"✅ Found timeline with clips: {tl.GetName()}")
+
+    # Check current markers
+    marker_count = len(tl.GetMarkers() or {})
+    print(f"  Current markers: {marker_count}\n")
+
+    # Try adding a new marker
+    print("🏷️ Trying to add marker @ frame 100...")
+    success = tl.AddMarker(100, "Cocoa", "Test API Marker", "Testing on timeline with clips", 0)
+
+    if success:
+        print("  ✅ SUCCESS! Marker added to timeline with clips!")
+    else:
+        print("  ❌ Failed even on timeline with clips")
+
+    # Re-fetch: the timeline's real state is the source of truth, not AddMarker's return
+    new_count = len(tl.GetMarkers() or {})
+    print(f"  Final markers: {new_count}")
+
+
+if __name__ == "__main__":
+    run(connect())
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Verify markers were added to principle timelines."""
 
+import re
+
 import DaVinciResolveScript as dvr
 
 resolve = dvr.scriptapp("Resolve")
@@ -18,26 +20,31 @@ target_timelines = [
     "Section — Teaser / Hook Preview",
 ]
 
-for i in range(1, int(proj.GetTimelineCount()) + 1):
-    tl = proj.GetTimelineByIndex(i)
+# One alternation scan per name instead of a substring test per target
+target_re = re.compile("|".join(map(re.escape, target_timelines)))
+
+# Fetch all timelines from Resolve in one burst, then filter in Python
+timelines = [proj.GetTimelineByIndex(i) for i in range(1, int(proj.GetTimelineCount()) + 1)]
+
+for tl in timelines:
     if not tl:
         continue
 
     name = tl.GetName()
 
     # Check if it matches any target
-    for target in target_timelines:
-        if target in name:
-            markers = tl.GetMarkers()
-            count = len(markers) if markers else 0
+    if not target_re.search(name):
+        continue
+
+    markers = tl.GetMarkers()
+    count = len(markers) if markers else 0
 
-            print(f"{'✅' if count > 0 else '❌'} {name}")
-            print(f"  Markers: {count}")
+    print(f"{'✅' if count > 0 else '❌'} {name}")
+    print(f"  Markers: {count}")
 
-            if markers and count <= 6:  # Show all if not too many
-                for frame, data in sorted(markers.items()):
-                    seconds = frame / 29.97
-                    print(f"    {seconds:.1f}s: [{data.get('color')}] {data.get('name')}")
+    if markers and count <= 6:  # Show all if not too many
+        for frame, data in sorted(markers.items()):
+            seconds = frame / 29.97
+            print(f"    {seconds:.1f}s: [{data.get('color')}] {data.get('name')}")
 
-            print()
-            break
+    print()
@@ -25,38 +25,30 @@ except Exception as e:
 
 # Import variant detector
 from the_dega_template_full import _selects_variant_for_title, SELECTS_BASE, SELECTS_SPECIFIC
+from resolve_utils import iter_timelines
 
-# Get all timelines
-tl_count = proj.GetTimelineCount()
 selects_timelines = []
 
-for i in range(1, tl_count + 1):
-    tl = proj.GetTimelineByIndex(i)
-    if not tl:
-        continue
+# One walk over the project; markers are only fetched for Selects & Stringouts
+for _tl, name, name_lower, markers in iter_timelines(
+    proj, keep=lambda n: any(tok in n for tok in ("selects", "stringout"))
+):
+    marker_count = len(markers)
 
-    name = tl.GetName()
-    name_lower = name.lower()
+    # Detect variant
+    variant = _selects_variant_for_title(name_lower)
 
-    # Filter for Selects & Stringouts
-    if "selects" in name_lower or "stringout" in name_lower:
-        markers = tl.GetMarkers()
-        marker_count = len(markers) if markers else 0
+    # Determine expected
+    if variant:
+        expected_min = len(SELECTS_BASE) + 2  # Base + at least 2 variant markers
+        status = "Enhanced" if marker_count >= expected_min else "Base only"
+    else:
+        expected_min = len(SELECTS_BASE)
+        status = "Base only"
 
-        # Detect variant
-        variant = _selects_variant_for_title(name_lower)
-
-        # Determine expected
-        if variant:
-            expected_min = len(SELECTS_BASE) + 2  # Base + at least 2 variant markers
-            status = "Enhanced" if marker_count >= expected_min else "Base only"
-        else:
-            expected_min = len(SELECTS_BASE)
-            status = "Base only"
-
-        selects_timelines.append(
-            {"name": name, "markers": marker_count, "variant": variant or "none", "status": status}
-        )
+    selects_timelines.append(
+        {"name": name, "markers": marker_count, "variant": variant or "none", "status": status}
+    )
 
 # Sort by name
 selects_timelines.sort(key=lambda x: x["name"])
@@ -68,6 +60,8 @@ print()
 print(f"{'Timeline':<50} | Markers | Variant          | Status")
 print("=" * 95)
 
+# Rows are buffered and written in one call rather than a print per timeline
+rows = []
 for tl in selects_timelines:
     # Truncate name if too long
     name = tl["name"][:48] + "..." if len(tl["name"]) > 50 else tl["name"]
@@ -75,9 +69,10 @@ for tl in selects_timelines:
     status_icon = "✅" if tl["status"] == "Enhanced" else "⚠️"
     variant_display = tl["variant"][:16]
 
-    print(f"{status_icon} {name:<48} | {tl['markers']:7} | {variant_display:<16} | {tl['status']}")
+    rows.append(f"{status_icon} {name:<48} | {tl['markers']:7} | {variant_display:<16} | {tl['status']}")
 
-print("=" * 95)
+rows.append("=" * 95)
+sys.stdout.write("\n".join(rows) + "\n")
 print()
 
 # Summary
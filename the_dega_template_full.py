@@ -18,29 +18,39 @@ What's new in v4.5
 """
 
 import datetime
+import functools
 import json
 import logging
 import os
 import re
-import struct
 import sys
-import wave
-from fractions import Fraction
+from collections import deque
 from contextlib import suppress
+from fractions import Fraction
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from typing import NamedTuple
 
 
 # ───────────────────────── Basics / Logging ─────────────────────────
+@functools.cache
 def _script_dir():
+    # realpath walks the path with a syscall per component; the answer never changes
     try:
         return os.path.dirname(os.path.realpath(__file__))
     except NameError:
         return os.getcwd()
 
 
+# Names of loggers setup_logger() has already wired; the module-level NullHandler means
+# "has handlers" can't tell a configured logger from a fresh import.
+_CONFIGURED_LOGGERS = set()
+
+
 def setup_logger(name="dega_builder", level=logging.INFO):
+    """Attach the stdout + file handlers (once); called from main(), not at import."""
     logger = logging.getLogger(name)
-    if logger.handlers:
+    if name in _CONFIGURED_LOGGERS:
         return logger
     logger.setLevel(level)
     log_dir = os.path.join(_script_dir(), "logs")
@@ -49,10 +59,10 @@ def setup_logger(name="dega_builder", level=logging.INFO):
     except Exception:
         log_dir = os.path.expanduser("~/tmp/dega_logs")
         os.makedirs(log_dir, exist_ok=True)
-    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_path = os.path.join(log_dir, f"dega_formula_builder_{stamp}.log")
+    log_path = os.path.join(log_dir, f"dega_formula_builder_{_STAMP}.log")
 
-    fmt = logging.Formatter("%(asctime)s | %(levelname)-8s | %(message)s")
+    # date lives in the log filename; one shared formatter, time-of-day only per record
+    fmt = logging.Formatter("{asctime} | {levelname:<8} | {message}", datefmt="%H:%M:%S", style="{")
     ch = logging.StreamHandler(sys.stdout)
     ch.setFormatter(fmt)
     fh = logging.FileHandler(log_path, mode="w", encoding="utf-8")
@@ -60,32 +70,28 @@ def setup_logger(name="dega_builder", level=logging.INFO):
     logger.addHandler(ch)
     logger.addHandler(fh)
     logger.propagate = False
+    _CONFIGURED_LOGGERS.add(name)
     logger.info("🚀 DEGA Formula Builder v4.7 starting…")
     logger.info("📝 Log file: %s", log_path)
     return logger
 
 
-log = setup_logger()
-root = logging.getLogger()
-if not root.handlers:
-    for handler in log.handlers:
-        root.addHandler(handler)
-    root.setLevel(log.level)
+# Handlers (and the log file) are attached lazily by setup_logger() in main(), so
+# importing this module for its templates/helpers has no filesystem side effects.
+log = logging.getLogger("dega_builder")
+log.addHandler(logging.NullHandler())
 
 
 # ───────────────────────── Resolve bootstrap ─────────────────────────
-try:
-    import DaVinciResolveScript as dvr
-except ImportError:
-    dvr = None
-try:
-    import bmd  # type: ignore
-except Exception:
-    bmd = None
-
-
+@functools.cache
 def get_resolve():
+    # Imported here (once) so loading this module never touches fusionscript.
     _bmd = globals().get("bmd")
+    if _bmd is None:
+        try:
+            import bmd as _bmd  # type: ignore
+        except Exception:
+            _bmd = None
     if _bmd:
         try:
             resolve = _bmd.scriptapp("Resolve")
@@ -94,6 +100,10 @@ def get_resolve():
                 return resolve
         except Exception as exc:
             log.warning("⚠️ bmd.scriptapp failed: %s", exc)
+    try:
+        import DaVinciResolveScript as dvr
+    except ImportError:
+        dvr = None
     try:
         resolve = dvr.scriptapp("Resolve") if dvr else None  # type: ignore
         if resolve:
@@ -108,20 +118,23 @@ def get_resolve():
 
 
 # ───────────────────────── Config ─────────────────────────
-TODAY = datetime.date.today().strftime("%Y-%m-%d")
+# One clock read: project names and the log filename share the same timestamp
+_NOW = datetime.datetime.now()
+TODAY = _NOW.strftime("%Y-%m-%d")
+_STAMP = _NOW.strftime("%Y%m%d_%H%M%S")
 PROJECT_NAME = f"DEGA_VERT_{TODAY.replace('-', '_')}"
-PROJECT_NAME_FALLBACK = f"DEGA_Project_{datetime.datetime.now().strftime('%H%M%S')}"
+PROJECT_NAME_FALLBACK = f"DEGA_Project_{_NOW.strftime('%H%M%S')}"
 WIDTH, HEIGHT, FPS = "2160", "3840", "29.97"
 
-TOP_BINS = [
+TOP_BINS = (
     "00 | 🏗 Templates",
     "01 | 💰 The Money",
     "02 | 🧪 The Formula",
     "99 | 📦 Exports",
-]
+)
 
 # Video tracks — TOP → BOTTOM (checkerboarding A-roll & B-roll)
-VIDEO_TRACKS_TOP_TO_BOTTOM = [
+VIDEO_TRACKS_TOP_TO_BOTTOM = (
     "FX TEMP 🧪",
     "SAFETY 🛑 — Guides (Disable for export)",
     "TITLES 🏷️",
@@ -132,10 +145,10 @@ VIDEO_TRACKS_TOP_TO_BOTTOM = [
     "B-ROLL A 🎞️",
     "A-ROLL B 🎥",
     "A-ROLL A 🎥",
-]
+)
 
 # Audio tracks — no numeric prefixes
-AUDIO_TRACKS = [
+AUDIO_TRACKS = (
     "DX_A",
     "DX_B",
     "VO_A",
@@ -153,18 +166,38 @@ AUDIO_TRACKS = [
     "AMB_A",
     "AMB_B",
     "PRINT",
-]
+)
 
 
 # ───────────────────────── Marker templates ─────────────────────────
+# Immutable so one template can be shared by every lane/tier that uses it.
+class Marker(NamedTuple):
+    t: float
+    color: str
+    name: str
+    dur: float
+    notes: str
+
+
+_MARKER_POOL = {}
+_T_KEY = attrgetter("t")  # C-level sort key for Markers
+
+
+def _is_time_sorted(markers):
+    return all(a.t <= b.t for a, b in zip(markers[:-1], markers[1:], strict=True))
+
+
+def _check_time_sorted(markers):
+    # explicit raise, not assert: the check must survive `python -O`
+    if not _is_time_sorted(markers):
+        raise ValueError(f"marker pack out of time order: {markers[0].name!r}")
+
+
 def _mm(when, color, name, dur, notes):
-    return {
-        "t": float(when),
-        "color": color,
-        "name": name,
-        "dur": float(dur),
-        "notes": notes,
-    }
+    # identical template entries (anchors, shared interrupts) resolve to one object;
+    # color/name repeat across every pack so they're interned (notes stay as-is)
+    m = Marker(float(when), sys.intern(color), sys.intern(name), float(dur), notes)
+    return _MARKER_POOL.setdefault(m, m)
 
 
 _SUPPORTED_MARKER_COLORS = {
@@ -180,706 +213,747 @@ _SUPPORTED_MARKER_COLORS = {
     "Orange",
 }
 _COLOR_FALLBACK = {"Magenta": "Pink", "Orange": "Yellow"}
+# Template color -> color sent to AddMarker. Unknown colors fall back to "Red".
+# (_COLOR_FALLBACK stays separate: _add_marker_safe retries a rejected color with it.)
+_MARKER_COLOR_RESOLVED = {
+    **{c: fb for c, fb in _COLOR_FALLBACK.items() if c not in _SUPPORTED_MARKER_COLORS},
+    **{c: c for c in _SUPPORTED_MARKER_COLORS},
+}
 
 
-MARKERS_12 = [
-    _mm(
-        0.000,
-        "Red",
-        "HOOK",
-        3.0,
-        "Range 0–3s. Open with the clearest value: a visual or line that states *what this is* and *why it matters* in plain language.",
-    ),
-    _mm(
-        3.000,
-        "Orange",
-        "DRAW",
-        5.0,
-        "Range 4–6s. Add one new angle or contrast that deepens curiosity; avoid repeating the hook wording.",
-    ),
-    _mm(
-        4.500,
-        "Magenta",
-        "INTERRUPT #1",
-        0.0,
-        "Micro pattern break (≤0.7s). Quick visual flip/cut-in that resets attention without derailing flow.",
-    ),
-    _mm(
-        8.000,
-        "Green",
-        "COMMIT / PAYOFF",
-        4.0,
-        "Range 3–5s. Deliver the promised clarity: tight demo/result/visual that proves the premise.",
-    ),
-    _mm(
-        9.000,
-        "Magenta",
-        "INTERRUPT #2",
-        0.0,
-        "Second micro jolt; invert framing or swap angle to avoid glide to the finish.",
-    ),
-    _mm(
-        11.600,
-        "Yellow",
-        "LOOP / CTA",
-        0.4,
-        "Range 0.3–1.0s. Button that either loops cleanly or gives one frictionless action.",
-    ),
-]
+# The tables below are only materialized on first use (a builder run or an
+# attribute access via the module __getattr__), not when the module is imported.
+@functools.cache
+def _build_lane_markers():
+    """Build LANE_MARKERS: lane -> {"12s"|"22s"|"30s": tuple of Markers}."""
+    MARKERS_12 = (
+        _mm(
+            0.000,
+            "Red",
+            "HOOK",
+            3.0,
+            "Range 0–3s. Open with the clearest value: a visual or line that states *what this is* and *why it matters* in plain language.",
+        ),
+        _mm(
+            3.000,
+            "Orange",
+            "DRAW",
+            5.0,
+            "Range 4–6s. Add one new angle or contrast that deepens curiosity; avoid repeating the hook wording.",
+        ),
+        _mm(
+            4.500,
+            "Magenta",
+            "INTERRUPT #1",
+            0.0,
+            "Micro pattern break (≤0.7s). Quick visual flip/cut-in that resets attention without derailing flow.",
+        ),
+        _mm(
+            8.000,
+            "Green",
+            "COMMIT / PAYOFF",
+            4.0,
+            "Range 3–5s. Deliver the promised clarity: tight demo/result/visual that proves the premise.",
+        ),
+        _mm(
+            9.000,
+            "Magenta",
+            "INTERRUPT #2",
+            0.0,
+            "Second micro jolt; invert framing or swap angle to avoid glide to the finish.",
+        ),
+        _mm(
+            11.600,
+            "Yellow",
+            "LOOP / CTA",
+            0.4,
+            "Range 0.3–1.0s. Button that either loops cleanly or gives one frictionless action.",
+        ),
+    )
 
 
-MARKERS_22 = [
-    _mm(
-        0.000,
-        "Red",
-        "HOOK",
-        3.0,
-        "Range 0–3s. Punchy premise stated plainly; no hedging.",
-    ),
-    _mm(
-        3.000,
-        "Orange",
-        "DRAW",
-        5.0,
-        "Range 4–6s. Add context or an unexpected contrast that still supports the hook.",
-    ),
-    _mm(
-        6.000,
-        "Magenta",
-        "INTERRUPT #1",
-        0.0,
-        "Early micro jolt (≤0.7s). Keeps the mid-section from flattening.",
-    ),
-    _mm(
-        8.000,
-        "Green",
-        "COMMIT / PAYOFF #1",
-        4.0,
-        "Range 3–5s. First clean delivery moment—proof, reveal, or tight before/after.",
-    ),
-    _mm(
-        12.000,
-        "Blue",
-        "SECOND HOOK",
-        3.0,
-        "Range 2–4s. Re-hook with a sharper angle or upside; avoid redundancy.",
-    ),
-    _mm(
-        13.500,
-        "Magenta",
-        "INTERRUPT #2",
-        0.0,
-        "Quick flip after second hook to prevent plateau.",
-    ),
-    _mm(
-        15.000,
-        "Purple",
-        "DEVELOP",
-        7.0,
-        "Range 6–8s. Stack 1–2 supporting beats; no rabbit holes.",
-    ),
-    _mm(18.500, "Magenta", "INTERRUPT #3", 0.0, "Penultimate jolt to prime the close."),
-    _mm(
-        21.300,
-        "Yellow",
-        "LOOP / CTA",
-        0.7,
-        "Range 0.5–1.2s. Clean loop or minimal ask with on-screen affordance.",
-    ),
-]
+    MARKERS_22 = (
+        _mm(
+            0.000,
+            "Red",
+            "HOOK",
+            3.0,
+            "Range 0–3s. Punchy premise stated plainly; no hedging.",
+        ),
+        _mm(
+            3.000,
+            "Orange",
+            "DRAW",
+            5.0,
+            "Range 4–6s. Add context or an unexpected contrast that still supports the hook.",
+        ),
+        _mm(
+            6.000,
+            "Magenta",
+            "INTERRUPT #1",
+            0.0,
+            "Early micro jolt (≤0.7s). Keeps the mid-section from flattening.",
+        ),
+        _mm(
+            8.000,
+            "Green",
+            "COMMIT / PAYOFF #1",
+            4.0,
+            "Range 3–5s. First clean delivery moment—proof, reveal, or tight before/after.",
+        ),
+        _mm(
+            12.000,
+            "Blue",
+            "SECOND HOOK",
+            3.0,
+            "Range 2–4s. Re-hook with a sharper angle or upside; avoid redundancy.",
+        ),
+        _mm(
+            13.500,
+            "Magenta",
+            "INTERRUPT #2",
+            0.0,
+            "Quick flip after second hook to prevent plateau.",
+        ),
+        _mm(
+            15.000,
+            "Purple",
+            "DEVELOP",
+            7.0,
+            "Range 6–8s. Stack 1–2 supporting beats; no rabbit holes.",
+        ),
+        _mm(18.500, "Magenta", "INTERRUPT #3", 0.0, "Penultimate jolt to prime the close."),
+        _mm(
+            21.300,
+            "Yellow",
+            "LOOP / CTA",
+            0.7,
+            "Range 0.5–1.2s. Clean loop or minimal ask with on-screen affordance.",
+        ),
+    )
 
 
-MARKERS_30 = [
-    _mm(
-        0.000,
-        "Red",
-        "HOOK",
-        3.0,
-        "Range 0–3s. Plain-speak promise; strong visual identity.",
-    ),
-    _mm(
-        3.000,
-        "Orange",
-        "DRAW",
-        5.0,
-        "Range 4–6s. Elevate intrigue via contrast/constraint/benefit.",
-    ),
-    _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Micro reset to avoid 6–10s slump."),
-    _mm(
-        8.000, "Green", "COMMIT / PAYOFF #1", 4.0, "Range 3–5s. Hard clarity moment #1."
-    ),
-    _mm(
-        12.000,
-        "Blue",
-        "SECOND HOOK",
-        3.0,
-        "Range 2–4s. Alternate entry point for scrollers; new phrasing.",
-    ),
-    _mm(
-        13.500, "Magenta", "INTERRUPT #2", 0.0, "Quick subversion; keep rhythm varied."
-    ),
-    _mm(
-        15.000,
-        "Purple",
-        "DEVELOP A",
-        7.0,
-        "Range 6–8s. Expand with one concise supporting angle.",
-    ),
-    _mm(20.000, "Magenta", "INTERRUPT #3", 0.0, "Reset cadence before last stretch."),
-    _mm(
-        22.000,
-        "Purple",
-        "DEVELOP B",
-        6.0,
-        "Range 5–7s. Second support; avoid duplication.",
-    ),
-    _mm(26.000, "Magenta", "INTERRUPT #4", 0.0, "Final micro jolt before close."),
-    _mm(
-        28.000,
-        "Yellow",
-        "FINAL PAYOFF / LOOP",
-        2.0,
-        "Range 1.5–3.0s. Clean visual loop or crisp CTA.",
-    ),
-]
+    MARKERS_30 = (
+        _mm(
+            0.000,
+            "Red",
+            "HOOK",
+            3.0,
+            "Range 0–3s. Plain-speak promise; strong visual identity.",
+        ),
+        _mm(
+            3.000,
+            "Orange",
+            "DRAW",
+            5.0,
+            "Range 4–6s. Elevate intrigue via contrast/constraint/benefit.",
+        ),
+        _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Micro reset to avoid 6–10s slump."),
+        _mm(
+            8.000, "Green", "COMMIT / PAYOFF #1", 4.0, "Range 3–5s. Hard clarity moment #1."
+        ),
+        _mm(
+            12.000,
+            "Blue",
+            "SECOND HOOK",
+            3.0,
+            "Range 2–4s. Alternate entry point for scrollers; new phrasing.",
+        ),
+        _mm(
+            13.500, "Magenta", "INTERRUPT #2", 0.0, "Quick subversion; keep rhythm varied."
+        ),
+        _mm(
+            15.000,
+            "Purple",
+            "DEVELOP A",
+            7.0,
+            "Range 6–8s. Expand with one concise supporting angle.",
+        ),
+        _mm(20.000, "Magenta", "INTERRUPT #3", 0.0, "Reset cadence before last stretch."),
+        _mm(
+            22.000,
+            "Purple",
+            "DEVELOP B",
+            6.0,
+            "Range 5–7s. Second support; avoid duplication.",
+        ),
+        _mm(26.000, "Magenta", "INTERRUPT #4", 0.0, "Final micro jolt before close."),
+        _mm(
+            28.000,
+            "Yellow",
+            "FINAL PAYOFF / LOOP",
+            2.0,
+            "Range 1.5–3.0s. Clean visual loop or crisp CTA.",
+        ),
+    )
 
-# Lane-specific tweaks (wording nudges) while keeping timing architecture aligned
-LANE_MARKERS = {
-    # Money & MV share the same cadence; MV wording emphasizes performance/visuals
-    "money": {"12s": MARKERS_12, "22s": MARKERS_22, "30s": MARKERS_30},
-    "mv": {
-        "12s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Signature Visual)",
-                3.0,
-                "Range 0–3s. Iconic pose/move or bold text: instantly tells what vibe this is.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Aesthetic Lift)",
-                5.0,
-                "Range 4–6s. Add a quick look change, location shift, or camera energy.",
-            ),
-            _mm(
-                4.500,
-                "Magenta",
-                "INTERRUPT #1",
-                0.0,
-                "≤0.7s. Micro cut/whip/push to reset attention.",
-            ),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF",
-                4.0,
-                "Range 3–5s. Tight performance moment or strong transition that feels 'earned'.",
-            ),
-            _mm(
-                9.000,
-                "Magenta",
-                "INTERRUPT #2",
-                0.0,
-                "Second micro flip to avoid slide to credits.",
-            ),
-            _mm(
-                11.600,
-                "Yellow",
-                "LOOP / CTA",
-                0.4,
-                "Range 0.3–1.0s. End on a repeatable motion or subtle action prompt.",
-            ),
-        ],
-        "22s": MARKERS_22,
-        "30s": MARKERS_30,
-    },
-    "fashion": {
-        "12s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Hero Fit Moment)",
-                3.0,
-                "Range 0–3s. One striking silhouette or texture close-up that defines the look.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Detail Contrast)",
-                5.0,
-                "Range 4–6s. Switch to fabric, accessories, or motion to add dimension.",
-            ),
-            _mm(
-                6.000, "Magenta", "INTERRUPT #1", 0.0, "≤0.7s. Quick angle/tempo flip."
-            ),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF",
-                4.0,
-                "Range 3–5s. Full-body reveal or clean style transition.",
+    # Lane-specific tweaks (wording nudges) while keeping timing architecture aligned
+    LANE_MARKERS = {
+        # Money & MV share the same cadence; MV wording emphasizes performance/visuals
+        "money": {"12s": MARKERS_12, "22s": MARKERS_22, "30s": MARKERS_30},
+        "mv": {
+            "12s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Signature Visual)",
+                    3.0,
+                    "Range 0–3s. Iconic pose/move or bold text: instantly tells what vibe this is.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Aesthetic Lift)",
+                    5.0,
+                    "Range 4–6s. Add a quick look change, location shift, or camera energy.",
+                ),
+                _mm(
+                    4.500,
+                    "Magenta",
+                    "INTERRUPT #1",
+                    0.0,
+                    "≤0.7s. Micro cut/whip/push to reset attention.",
+                ),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF",
+                    4.0,
+                    "Range 3–5s. Tight performance moment or strong transition that feels 'earned'.",
+                ),
+                _mm(
+                    9.000,
+                    "Magenta",
+                    "INTERRUPT #2",
+                    0.0,
+                    "Second micro flip to avoid slide to credits.",
+                ),
+                _mm(
+                    11.600,
+                    "Yellow",
+                    "LOOP / CTA",
+                    0.4,
+                    "Range 0.3–1.0s. End on a repeatable motion or subtle action prompt.",
+                ),
             ),
-            _mm(
-                11.600,
-                "Yellow",
-                "LOOP / CTA",
-                0.4,
-                "Range 0.3–1.0s. Loopable step/turn or minimal ask.",
-            ),
-        ],
-        "22s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Look Identity)",
-                3.0,
-                "Range 0–3s. State the vibe: street/clean/retro/etc. via a hero frame.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Texture/Movement)",
-                5.0,
-                "Range 4–6s. Fabric motion or accessory interaction.",
-            ),
-            _mm(
-                6.000,
-                "Magenta",
-                "INTERRUPT #1",
-                0.0,
-                "≤0.7s. Angle/location micro switch.",
-            ),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF #1",
-                4.0,
-                "Range 3–5s. Full outfit clarity.",
-            ),
-            _mm(
-                12.000,
-                "Blue",
-                "SECOND HOOK (Alt Styling)",
-                3.0,
-                "Range 2–4s. Secondary combo or layer change.",
-            ),
-            _mm(
-                15.000,
-                "Purple",
-                "DEVELOP",
-                7.0,
-                "Range 6–8s. 1–2 beats: close-ups, pocket pulls, hem, shoe detail.",
-            ),
-            _mm(
-                21.300,
-                "Yellow",
-                "LOOP / CTA",
-                0.7,
-                "Range 0.5–1.2s. Loopable walk-by or glance.",
-            ),
-        ],
-        "30s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Statement Frame)",
-                3.0,
-                "Range 0–3s. Pose, lensing, or lighting that telegraphs tone.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Cutaway Detail)",
-                5.0,
-                "Range 4–6s. Textures, stitching, hardware.",
-            ),
-            _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Micro jolt."),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF #1",
-                4.0,
-                "Range 3–5s. Head-to-toe moment.",
-            ),
-            _mm(
-                12.000,
-                "Blue",
-                "SECOND HOOK",
-                3.0,
-                "Range 2–4s. Alternate palette/prop.",
-            ),
-            _mm(
-                15.000,
-                "Purple",
-                "DEVELOP A",
-                7.0,
-                "Range 6–8s. Movement sequence: walk, turn, sit.",
-            ),
-            _mm(
-                22.000,
-                "Purple",
-                "DEVELOP B",
-                6.0,
-                "Range 5–7s. Environment integration.",
-            ),
-            _mm(
-                28.000,
-                "Yellow",
-                "FINAL PAYOFF / LOOP",
-                2.0,
-                "Range 1.5–3.0s. Seamless loop or subtle CTA.",
-            ),
-        ],
-    },
-    "talking": {
-        "12s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Plain-Speak Claim)",
-                3.0,
-                "Range 0–3s. One-sentence promise with a direct face angle.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Setup in One Line)",
-                5.0,
-                "Range 4–6s. Short context that *increases* curiosity.",
-            ),
-            _mm(
-                6.000,
-                "Magenta",
-                "INTERRUPT #1",
-                0.0,
-                "≤0.7s. Insert quick B-roll or on-screen receipt.",
-            ),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF",
-                4.0,
-                "Range 3–5s. The clear takeaway or micro demo.",
-            ),
-            _mm(
-                11.600,
-                "Yellow",
-                "LOOP / CTA",
-                0.4,
-                "Range 0.3–1.0s. Frictionless close.",
-            ),
-        ],
-        "22s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Outcome First)",
-                3.0,
-                "Range 0–3s. Lead with result/benefit plainly.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Short Context)",
-                5.0,
-                "Range 4–6s. Add one surprise fact or contrast.",
-            ),
-            _mm(
-                6.000,
-                "Magenta",
-                "INTERRUPT #1",
-                0.0,
-                "≤0.7s. Pattern break: quick insert or angle swap.",
-            ),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF #1",
-                4.0,
-                "Range 3–5s. First clear point.",
-            ),
-            _mm(
-                12.000,
-                "Blue",
-                "SECOND HOOK",
-                3.0,
-                "Range 2–4s. Re-articulate upside in fresher words.",
-            ),
-            _mm(
-                15.000,
-                "Purple",
-                "DEVELOP",
-                7.0,
-                "Range 6–8s. One supporting example; avoid tangents.",
-            ),
-            _mm(21.300, "Yellow", "LOOP / CTA", 0.7, "Range 0.5–1.2s. End crisp."),
-        ],
-        "30s": [
-            _mm(0.000, "Red", "HOOK (Punchy Thesis)", 3.0, "Range 0–3s. No hedging."),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Angle Boost)",
-                5.0,
-                "Range 4–6s. Sharpen tension without jargon.",
-            ),
-            _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Micro reset."),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF #1",
-                4.0,
-                "Range 3–5s. Clear, specific point.",
-            ),
-            _mm(
-                12.000,
-                "Blue",
-                "SECOND HOOK",
-                3.0,
-                "Range 2–4s. New phrasing for late arrivals.",
-            ),
-            _mm(
-                15.000, "Purple", "DEVELOP A", 7.0, "Range 6–8s. Example or tiny case."
-            ),
-            _mm(
-                22.000,
-                "Purple",
-                "DEVELOP B",
-                6.0,
-                "Range 5–7s. Short application/implication.",
-            ),
-            _mm(
-                28.000,
-                "Yellow",
-                "FINAL PAYOFF / LOOP",
-                2.0,
-                "Range 1.5–3.0s. Tight loop or ask.",
-            ),
-        ],
-    },
-    "dil": {  # Day in the Life
-        "12s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Moment in Progress)",
-                3.0,
-                "Range 0–3s. Drop viewer into motion; avoid slow preamble.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (What's Next?)",
-                5.0,
-                "Range 4–6s. Tease destination/task contrast.",
-            ),
-            _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "≤0.7s. Tempo flip."),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF",
-                4.0,
-                "Range 3–5s. Satisfying micro-resolution (arrive/complete/transition).",
-            ),
-            _mm(
-                11.600,
-                "Yellow",
-                "LOOP / CTA",
-                0.4,
-                "Range 0.3–1.0s. Loopable motion or minimal ask.",
-            ),
-        ],
-        "22s": [
-            _mm(0.000, "Red", "HOOK (Drop-In)", 3.0, "Range 0–3s. Start mid-action."),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Mini Arc)",
-                5.0,
-                "Range 4–6s. Set tiny objective/change.",
-            ),
-            _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "≤0.7s. Micro reset."),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF #1",
-                4.0,
-                "Range 3–5s. Hit a checkpoint.",
-            ),
-            _mm(12.000, "Blue", "SECOND HOOK", 3.0, "Range 2–4s. New micro-goal."),
-            _mm(
-                15.000,
-                "Purple",
-                "DEVELOP",
-                7.0,
-                "Range 6–8s. Texture beats (ambient, details).",
-            ),
-            _mm(
-                21.300,
-                "Yellow",
-                "LOOP / CTA",
-                0.7,
-                "Range 0.5–1.2s. End in motion for loop.",
-            ),
-        ],
-        "30s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Live Snapshot)",
-                3.0,
-                "Range 0–3s. Immediate immersion.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Tension/Contrast)",
-                5.0,
-                "Range 4–6s. Set a tiny tension to resolve.",
-            ),
-            _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Quick changeup."),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF #1",
-                4.0,
-                "Range 3–5s. Satisfy the first micro-goal.",
-            ),
-            _mm(12.000, "Blue", "SECOND HOOK", 3.0, "Range 2–4s. Lure late scrollers."),
-            _mm(
-                15.000, "Purple", "DEVELOP A", 7.0, "Range 6–8s. Environment & texture."
-            ),
-            _mm(
-                22.000,
-                "Purple",
-                "DEVELOP B",
-                6.0,
-                "Range 5–7s. Human beat or detail set.",
-            ),
-            _mm(
-                28.000,
-                "Yellow",
-                "FINAL PAYOFF / LOOP",
-                2.0,
-                "Range 1.5–3.0s. Loopable exit/enter.",
-            ),
-        ],
-    },
-    "cook": {  # Cook-Ups
-        "12s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Signature Sound/Move)",
-                3.0,
-                "Range 0–3s. Instantly show the identity: pad hit, finger drum, or motif.",
-            ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Layer or Constraint)",
-                5.0,
-                "Range 4–6s. Tease a layer you'll add or a flip you'll attempt.",
-            ),
-            _mm(
-                6.000,
-                "Magenta",
-                "INTERRUPT #1",
-                0.0,
-                "≤0.7s. Micro switch to screen/overhead.",
+            "22s": MARKERS_22,
+            "30s": MARKERS_30,
+        },
+        "fashion": {
+            "12s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Hero Fit Moment)",
+                    3.0,
+                    "Range 0–3s. One striking silhouette or texture close-up that defines the look.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Detail Contrast)",
+                    5.0,
+                    "Range 4–6s. Switch to fabric, accessories, or motion to add dimension.",
+                ),
+                _mm(
+                    6.000, "Magenta", "INTERRUPT #1", 0.0, "≤0.7s. Quick angle/tempo flip."
+                ),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF",
+                    4.0,
+                    "Range 3–5s. Full-body reveal or clean style transition.",
+                ),
+                _mm(
+                    11.600,
+                    "Yellow",
+                    "LOOP / CTA",
+                    0.4,
+                    "Range 0.3–1.0s. Loopable step/turn or minimal ask.",
+                ),
             ),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF",
-                4.0,
-                "Range 3–5s. Small but satisfying musical 'click' (layer locks, groove snaps).",
+            "22s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Look Identity)",
+                    3.0,
+                    "Range 0–3s. State the vibe: street/clean/retro/etc. via a hero frame.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Texture/Movement)",
+                    5.0,
+                    "Range 4–6s. Fabric motion or accessory interaction.",
+                ),
+                _mm(
+                    6.000,
+                    "Magenta",
+                    "INTERRUPT #1",
+                    0.0,
+                    "≤0.7s. Angle/location micro switch.",
+                ),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF #1",
+                    4.0,
+                    "Range 3–5s. Full outfit clarity.",
+                ),
+                _mm(
+                    12.000,
+                    "Blue",
+                    "SECOND HOOK (Alt Styling)",
+                    3.0,
+                    "Range 2–4s. Secondary combo or layer change.",
+                ),
+                _mm(
+                    15.000,
+                    "Purple",
+                    "DEVELOP",
+                    7.0,
+                    "Range 6–8s. 1–2 beats: close-ups, pocket pulls, hem, shoe detail.",
+                ),
+                _mm(
+                    21.300,
+                    "Yellow",
+                    "LOOP / CTA",
+                    0.7,
+                    "Range 0.5–1.2s. Loopable walk-by or glance.",
+                ),
             ),
-            _mm(
-                11.600,
-                "Yellow",
-                "LOOP / CTA",
-                0.4,
-                "Range 0.3–1.0s. Seamless loop or tiny ask.",
+            "30s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Statement Frame)",
+                    3.0,
+                    "Range 0–3s. Pose, lensing, or lighting that telegraphs tone.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Cutaway Detail)",
+                    5.0,
+                    "Range 4–6s. Textures, stitching, hardware.",
+                ),
+                _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Micro jolt."),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF #1",
+                    4.0,
+                    "Range 3–5s. Head-to-toe moment.",
+                ),
+                _mm(
+                    12.000,
+                    "Blue",
+                    "SECOND HOOK",
+                    3.0,
+                    "Range 2–4s. Alternate palette/prop.",
+                ),
+                _mm(
+                    15.000,
+                    "Purple",
+                    "DEVELOP A",
+                    7.0,
+                    "Range 6–8s. Movement sequence: walk, turn, sit.",
+                ),
+                _mm(
+                    22.000,
+                    "Purple",
+                    "DEVELOP B",
+                    6.0,
+                    "Range 5–7s. Environment integration.",
+                ),
+                _mm(
+                    28.000,
+                    "Yellow",
+                    "FINAL PAYOFF / LOOP",
+                    2.0,
+                    "Range 1.5–3.0s. Seamless loop or subtle CTA.",
+                ),
             ),
-        ],
-        "22s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Instant Identity)",
-                3.0,
-                "Range 0–3s. The 'ohhh' sound/move first.",
+        },
+        "talking": {
+            "12s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Plain-Speak Claim)",
+                    3.0,
+                    "Range 0–3s. One-sentence promise with a direct face angle.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Setup in One Line)",
+                    5.0,
+                    "Range 4–6s. Short context that *increases* curiosity.",
+                ),
+                _mm(
+                    6.000,
+                    "Magenta",
+                    "INTERRUPT #1",
+                    0.0,
+                    "≤0.7s. Insert quick B-roll or on-screen receipt.",
+                ),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF",
+                    4.0,
+                    "Range 3–5s. The clear takeaway or micro demo.",
+                ),
+                _mm(
+                    11.600,
+                    "Yellow",
+                    "LOOP / CTA",
+                    0.4,
+                    "Range 0.3–1.0s. Frictionless close.",
+                ),
             ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (What You'll Build)",
-                5.0,
-                "Range 4–6s. Promise the flip: key/tempo/session context (fast).",
+            "22s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Outcome First)",
+                    3.0,
+                    "Range 0–3s. Lead with result/benefit plainly.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Short Context)",
+                    5.0,
+                    "Range 4–6s. Add one surprise fact or contrast.",
+                ),
+                _mm(
+                    6.000,
+                    "Magenta",
+                    "INTERRUPT #1",
+                    0.0,
+                    "≤0.7s. Pattern break: quick insert or angle swap.",
+                ),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF #1",
+                    4.0,
+                    "Range 3–5s. First clear point.",
+                ),
+                _mm(
+                    12.000,
+                    "Blue",
+                    "SECOND HOOK",
+                    3.0,
+                    "Range 2–4s. Re-articulate upside in fresher words.",
+                ),
+                _mm(
+                    15.000,
+                    "Purple",
+                    "DEVELOP",
+                    7.0,
+                    "Range 6–8s. One supporting example; avoid tangents.",
+                ),
+                _mm(21.300, "Yellow", "LOOP / CTA", 0.7, "Range 0.5–1.2s. End crisp."),
             ),
-            _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "≤0.7s. Angle/UI micro cut."),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF #1",
-                4.0,
-                "Range 3–5s. First groove lock.",
+            "30s": (
+                _mm(0.000, "Red", "HOOK (Punchy Thesis)", 3.0, "Range 0–3s. No hedging."),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Angle Boost)",
+                    5.0,
+                    "Range 4–6s. Sharpen tension without jargon.",
+                ),
+                _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Micro reset."),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF #1",
+                    4.0,
+                    "Range 3–5s. Clear, specific point.",
+                ),
+                _mm(
+                    12.000,
+                    "Blue",
+                    "SECOND HOOK",
+                    3.0,
+                    "Range 2–4s. New phrasing for late arrivals.",
+                ),
+                _mm(
+                    15.000, "Purple", "DEVELOP A", 7.0, "Range 6–8s. Example or tiny case."
+                ),
+                _mm(
+                    22.000,
+                    "Purple",
+                    "DEVELOP B",
+                    6.0,
+                    "Range 5–7s. Short application/implication.",
+                ),
+                _mm(
+                    28.000,
+                    "Yellow",
+                    "FINAL PAYOFF / LOOP",
+                    2.0,
+                    "Range 1.5–3.0s. Tight loop or ask.",
+                ),
             ),
-            _mm(12.000, "Blue", "SECOND HOOK", 3.0, "Range 2–4s. Catchier motif/turn."),
-            _mm(
-                15.000,
-                "Purple",
-                "DEVELOP",
-                7.0,
-                "Range 6–8s. Add/remove tension: short fills, mute plays, knob rides.",
+        },
+        "dil": {  # Day in the Life
+            "12s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Moment in Progress)",
+                    3.0,
+                    "Range 0–3s. Drop viewer into motion; avoid slow preamble.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (What's Next?)",
+                    5.0,
+                    "Range 4–6s. Tease destination/task contrast.",
+                ),
+                _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "≤0.7s. Tempo flip."),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF",
+                    4.0,
+                    "Range 3–5s. Satisfying micro-resolution (arrive/complete/transition).",
+                ),
+                _mm(
+                    11.600,
+                    "Yellow",
+                    "LOOP / CTA",
+                    0.4,
+                    "Range 0.3–1.0s. Loopable motion or minimal ask.",
+                ),
             ),
-            _mm(21.300, "Yellow", "LOOP / CTA", 0.7, "Range 0.5–1.2s. Clean loop."),
-        ],
-        "30s": [
-            _mm(
-                0.000,
-                "Red",
-                "HOOK (Immediate Sauce)",
-                3.0,
-                "Range 0–3s. Start at the most *you* sound.",
+            "22s": (
+                _mm(0.000, "Red", "HOOK (Drop-In)", 3.0, "Range 0–3s. Start mid-action."),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Mini Arc)",
+                    5.0,
+                    "Range 4–6s. Set tiny objective/change.",
+                ),
+                _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "≤0.7s. Micro reset."),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF #1",
+                    4.0,
+                    "Range 3–5s. Hit a checkpoint.",
+                ),
+                _mm(12.000, "Blue", "SECOND HOOK", 3.0, "Range 2–4s. New micro-goal."),
+                _mm(
+                    15.000,
+                    "Purple",
+                    "DEVELOP",
+                    7.0,
+                    "Range 6–8s. Texture beats (ambient, details).",
+                ),
+                _mm(
+                    21.300,
+                    "Yellow",
+                    "LOOP / CTA",
+                    0.7,
+                    "Range 0.5–1.2s. End in motion for loop.",
+                ),
             ),
-            _mm(
-                3.000,
-                "Orange",
-                "DRAW (Set the Game)",
-                5.0,
-                "Range 4–6s. 'Here's the flip' in one line.",
+            "30s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Live Snapshot)",
+                    3.0,
+                    "Range 0–3s. Immediate immersion.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Tension/Contrast)",
+                    5.0,
+                    "Range 4–6s. Set a tiny tension to resolve.",
+                ),
+                _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Quick changeup."),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF #1",
+                    4.0,
+                    "Range 3–5s. Satisfy the first micro-goal.",
+                ),
+                _mm(12.000, "Blue", "SECOND HOOK", 3.0, "Range 2–4s. Lure late scrollers."),
+                _mm(
+                    15.000, "Purple", "DEVELOP A", 7.0, "Range 6–8s. Environment & texture."
+                ),
+                _mm(
+                    22.000,
+                    "Purple",
+                    "DEVELOP B",
+                    6.0,
+                    "Range 5–7s. Human beat or detail set.",
+                ),
+                _mm(
+                    28.000,
+                    "Yellow",
+                    "FINAL PAYOFF / LOOP",
+                    2.0,
+                    "Range 1.5–3.0s. Loopable exit/enter.",
+                ),
             ),
-            _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Micro cut/angle."),
-            _mm(
-                8.000,
-                "Green",
-                "COMMIT / PAYOFF #1",
-                4.0,
-                "Range 3–5s. First lock moment.",
+        },
+        "cook": {  # Cook-Ups
+            "12s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Signature Sound/Move)",
+                    3.0,
+                    "Range 0–3s. Instantly show the identity: pad hit, finger drum, or motif.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Layer or Constraint)",
+                    5.0,
+                    "Range 4–6s. Tease a layer you'll add or a flip you'll attempt.",
+                ),
+                _mm(
+                    6.000,
+                    "Magenta",
+                    "INTERRUPT #1",
+                    0.0,
+                    "≤0.7s. Micro switch to screen/overhead.",
+                ),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF",
+                    4.0,
+                    "Range 3–5s. Small but satisfying musical 'click' (layer locks, groove snaps).",
+                ),
+                _mm(
+                    11.600,
+                    "Yellow",
+                    "LOOP / CTA",
+                    0.4,
+                    "Range 0.3–1.0s. Seamless loop or tiny ask.",
+                ),
             ),
-            _mm(12.000, "Blue", "SECOND HOOK", 3.0, "Range 2–4s. Stronger motif."),
-            _mm(15.000, "Purple", "DEVELOP A", 7.0, "Range 6–8s. Arrange mini-arc."),
-            _mm(
-                22.000,
-                "Purple",
-                "DEVELOP B",
-                6.0,
-                "Range 5–7s. Short performance burst.",
+            "22s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Instant Identity)",
+                    3.0,
+                    "Range 0–3s. The 'ohhh' sound/move first.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (What You'll Build)",
+                    5.0,
+                    "Range 4–6s. Promise the flip: key/tempo/session context (fast).",
+                ),
+                _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "≤0.7s. Angle/UI micro cut."),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF #1",
+                    4.0,
+                    "Range 3–5s. First groove lock.",
+                ),
+                _mm(12.000, "Blue", "SECOND HOOK", 3.0, "Range 2–4s. Catchier motif/turn."),
+                _mm(
+                    15.000,
+                    "Purple",
+                    "DEVELOP",
+                    7.0,
+                    "Range 6–8s. Add/remove tension: short fills, mute plays, knob rides.",
+                ),
+                _mm(21.300, "Yellow", "LOOP / CTA", 0.7, "Range 0.5–1.2s. Clean loop."),
             ),
-            _mm(
-                28.000,
-                "Yellow",
-                "FINAL PAYOFF / LOOP",
-                2.0,
-                "Range 1.5–3.0s. Loop land.",
+            "30s": (
+                _mm(
+                    0.000,
+                    "Red",
+                    "HOOK (Immediate Sauce)",
+                    3.0,
+                    "Range 0–3s. Start at the most *you* sound.",
+                ),
+                _mm(
+                    3.000,
+                    "Orange",
+                    "DRAW (Set the Game)",
+                    5.0,
+                    "Range 4–6s. 'Here's the flip' in one line.",
+                ),
+                _mm(6.000, "Magenta", "INTERRUPT #1", 0.0, "Micro cut/angle."),
+                _mm(
+                    8.000,
+                    "Green",
+                    "COMMIT / PAYOFF #1",
+                    4.0,
+                    "Range 3–5s. First lock moment.",
+                ),
+                _mm(12.000, "Blue", "SECOND HOOK", 3.0, "Range 2–4s. Stronger motif."),
+                _mm(15.000, "Purple", "DEVELOP A", 7.0, "Range 6–8s. Arrange mini-arc."),
+                _mm(
+                    22.000,
+                    "Purple",
+                    "DEVELOP B",
+                    6.0,
+                    "Range 5–7s. Short performance burst.",
+                ),
+                _mm(
+                    28.000,
+                    "Yellow",
+                    "FINAL PAYOFF / LOOP",
+                    2.0,
+                    "Range 1.5–3.0s. Loop land.",
+                ),
             ),
-        ],
-    },
-}
+        },
+    }
+    # hand-authored packs must already be in time order (checked once, here)
+    for tiers in LANE_MARKERS.values():
+        for pack in tiers.values():
+            _check_time_sorted(pack)
+    return LANE_MARKERS
+
+
+@functools.cache
+def _lane_markers_flat():
+    # flat (lane, tier) view used by the builders; LANE_MARKERS stays the readable source
+    return {
+        (lane, tier): pack
+        for lane, tiers in _build_lane_markers().items()
+        for tier, pack in tiers.items()
+    }
+
+
+_MONEY_TIER_ALIASES = {"MARKERS_12": "12s", "MARKERS_22": "22s", "MARKERS_30": "30s"}
+
+
+def __getattr__(name):
+    # PEP 562: MARKERS_12/22/30, LANE_MARKERS and LANE_MARKERS_FLAT stay importable
+    if name == "LANE_MARKERS":
+        return _build_lane_markers()
+    if name == "LANE_MARKERS_FLAT":
+        return _lane_markers_flat()
+    if name in _MONEY_TIER_ALIASES:
+        return _build_lane_markers()["money"][_MONEY_TIER_ALIASES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ──────────────────────────────────────────────────────────────
 # Principle markers (non-interactive reminders for non-master timelines)
@@ -887,34 +961,43 @@ LANE_MARKERS = {
 
 
 def _mp(t, color, name, notes, dur=0.0):
-    # tiny alias - note: _mm takes (t, color, name, dur, notes) so we swap the last two params
-    return _mm(t, color, name, dur, notes)
+    # same as _mm with (notes, dur) swapped; builds the Marker here instead of
+    # forwarding so each of the ~100 principle entries costs one call, not two
+    m = Marker(float(t), sys.intern(color), sys.intern(name), float(dur), notes)
+    return _MARKER_POOL.setdefault(m, m)
+
+
+# Timeline-duration anchor shared by every ShotFX/Selects/principle pack
+_ANCHOR_5MIN = _mp(299.0, "Blue", "⏱ 5min anchor", "")
+_ANCHOR_5MIN_NOTED = _mp(
+    299.0, "Blue", "⏱ 5min anchor", "Timeline duration marker (auto-generated)"
+)
 
 
 # ───────────────────────── ShotFX variant marker packs ─────────────────────────
 
 
+# (variant, needles, prefixes), walked in order by _match_title_rules: the first rule
+# with a needle in the title wins. ("background", "cleanup") needs both words, in any order.
+_SHOTFX_VARIANT_RULES = (
+    ("clone", ("clone",), ()),
+    ("clean_plate", ("clean plate",), ()),
+    ("background_cleanup", (("background", "cleanup"),), ()),
+    ("remove_mic_cable", (("remove", "mic"), "mic cable"), ()),
+    ("hand_split", ("hand split",), ()),
+    ("screen_insert", ("screen insert", "(ui)", ("screen", "insert")), ()),
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def _shotfx_variant_for_title(norm_title: str):
     """Detect which ShotFX variant to use based on timeline name."""
-    t = norm_title.lower()
-    if "clone" in t:
-        return "clone"
-    if "clean plate" in t:
-        return "clean_plate"
-    if "background" in t and "cleanup" in t:
-        return "background_cleanup"
-    if ("remove" in t and "mic" in t) or "mic cable" in t:
-        return "remove_mic_cable"
-    if "hand split" in t:
-        return "hand_split"
-    if "screen insert" in t or "(ui)" in t or ("screen" in t and "insert" in t):
-        return "screen_insert"
-    return None
+    return _match_title_rules(_norm_title(norm_title), _SHOTFX_VARIANT_RULES)
 
 
 SHOTFX_SPECIFIC = {
     # Music-video clone / hallway clone, etc.
-    "clone": [
+    "clone": (
         _mp(
             0.0,
             "Orange",
@@ -957,10 +1040,10 @@ SHOTFX_SPECIFIC = {
             "Continuity glance",
             "Watch hands/feet for pops at the seam during moves; micro-transform if necessary.",
         ),
-        _mp(299.0, "Blue", "⏱ 5min anchor", ""),
-    ],
+        _ANCHOR_5MIN,
+    ),
     # Beauty cleanup using a clean plate or adjacent frame
-    "clean_plate": [
+    "clean_plate": (
         _mp(
             0.0,
             "Orange",
@@ -997,10 +1080,10 @@ SHOTFX_SPECIFIC = {
             "Color/Specular",
             "Match micro highlights; reduce spec hotspots with gentle curve, not blur.",
         ),
-        _mp(299.0, "Blue", "⏱ 5min anchor", ""),
-    ],
+        _ANCHOR_5MIN,
+    ),
     # Removing signs, cables, wall junk, etc.
-    "background_cleanup": [
+    "background_cleanup": (
         _mp(
             0.0,
             "Orange",
@@ -1031,10 +1114,10 @@ SHOTFX_SPECIFIC = {
             "Grain / noise",
             "Sample target area's noise level; add back after composite to prevent 'cutout' look.",
         ),
-        _mp(299.0, "Blue", "⏱ 5min anchor", ""),
-    ],
+        _ANCHOR_5MIN,
+    ),
     # Paint-out for a lav/mic cable crossing the hand/arm
-    "remove_mic_cable": [
+    "remove_mic_cable": (
         _mp(
             0.0,
             "Orange",
@@ -1071,10 +1154,10 @@ SHOTFX_SPECIFIC = {
             "Final grain",
             "Add matched grain over the composite; check at 100% zoom.",
         ),
-        _mp(299.0, "Blue", "⏱ 5min anchor", ""),
-    ],
+        _ANCHOR_5MIN,
+    ),
     # Split/duplicate hand at sampler/pads
-    "hand_split": [
+    "hand_split": (
         _mp(
             0.0,
             "Orange",
@@ -1111,10 +1194,10 @@ SHOTFX_SPECIFIC = {
             "Micro parallax",
             "If hands drift apart, micro-warp one plate to the other near the seam.",
         ),
-        _mp(299.0, "Blue", "⏱ 5min anchor", ""),
-    ],
+        _ANCHOR_5MIN,
+    ),
     # Screen/UI insert
-    "screen_insert": [
+    "screen_insert": (
         _mp(
             0.0,
             "Orange",
@@ -1151,49 +1234,67 @@ SHOTFX_SPECIFIC = {
             "Light spill",
             "Add light wrap onto bezels/fingers at bright frames; very low opacity.",
         ),
-        _mp(299.0, "Blue", "⏱ 5min anchor", ""),
-    ],
+        _ANCHOR_5MIN,
+    ),
 }
 
 # ───────────────────────── Selects & Stringouts packs ─────────────────────────
 
 
-def _selects_variant_for_title(norm_title: str):
-    """Detect which Selects/Stringouts variant to use based on timeline name."""
-    t = norm_title.lower()
+@functools.lru_cache(maxsize=4096)
+def _norm_title(title):
+    """Lowercase a timeline title and fold em/en dashes to "-" (memoized)."""
+    return str(title or "").lower().replace("—", "-").replace("–", "-")
+
+
+def _needle_in(needle, t):
+    # a str needle is a substring; a tuple needle needs all of its words present
+    if isinstance(needle, str):
+        return needle in t
+    return all(word in t for word in needle)
+
+
+# Title keyword rules (run against _norm_title output), checked in priority order (first hit wins):
+# (result, substrings, prefixes) — a rule matches if any substring occurs or the
+# title starts with any prefix. Built once; the classifiers just walk the table.
+def _match_title_rules(t, rules):
+    for result, contains, prefixes in rules:
+        if t.startswith(prefixes) or any(_needle_in(needle, t) for needle in contains):
+            return result
+    return None
+
+
+# Order is match priority, not hit frequency: the builder emits only 1-3 timelines per
+# variant (no skew to exploit), lookups are cached upstream, and several needles overlap
+# (a "B-Roll Selects — Commute" title must stay "broll"). Keep the order when editing.
+_SELECTS_VARIANT_RULES = (
     # Music-video / general performance selects
-    if "perf selects" in t or "performance selects" in t:
-        return "mv_perf"
+    ("mv_perf", ("perf selects", "performance selects"), ()),
     # General B-Roll selects used across lanes
-    if "b-roll selects" in t or "broll selects" in t:
-        return "broll"
+    ("broll", ("b-roll selects", "broll selects"), ()),
     # Fashion
-    if "look selects" in t:
-        return "fashion_look"
+    ("fashion_look", ("look selects",), ()),
     # Talking head
-    if "a-roll selects" in t or "aroll selects" in t:
-        return "th_aroll"
+    ("th_aroll", ("a-roll selects", "aroll selects"), ()),
     # Day in the Life
-    if "selects — commute" in t or "selects - commute" in t or "commute" in t:
-        return "dil_commute"
-    if "coffee" in t:
-        return "dil_coffee"
-    if t.startswith("selects —") or t.startswith("selects -"):
-        return "dil_generic"
+    ("dil_commute", ("commute",), ()),
+    ("dil_coffee", ("coffee",), ()),
+    ("dil_generic", (), ("selects -",)),
     # Cook-Ups
-    if "overhead selects" in t:
-        return "cook_overhead"
-    if "front cam selects" in t or "front-camera selects" in t:
-        return "cook_front"
-    if "foley/prod selects" in t or "foley selects" in t or "prod selects" in t:
-        return "cook_foley"
+    ("cook_overhead", ("overhead selects",), ()),
+    ("cook_front", ("front cam selects", "front-camera selects"), ()),
+    ("cook_foley", ("foley/prod selects", "foley selects", "prod selects"), ()),
     # Stringouts (generic)
-    if "stringout" in t:
-        return "stringout_generic"
-    return None
+    ("stringout_generic", ("stringout",), ()),
+)
 
 
-SELECTS_BASE = [
+def _selects_variant_for_title(norm_title: str):
+    """Detect which Selects/Stringouts variant to use based on timeline name."""
+    return _match_title_rules(_norm_title(norm_title), _SELECTS_VARIANT_RULES)
+
+
+SELECTS_BASE = (
     _mp(
         0.0,
         "Purple",
@@ -1224,12 +1325,12 @@ SELECTS_BASE = [
         "Stringout pointers",
         "Range-mark best beats; leave short gaps between ideas to hear pacing honestly.",
     ),
-    _mp(299.0, "Blue", "⏱ 5min anchor", ""),
-]
+    _ANCHOR_5MIN,
+)
 
 SELECTS_SPECIFIC = {
     # ——— Music-Video
-    "mv_perf": [
+    "mv_perf": (
         _mp(
             5.0,
             "Red",
@@ -1248,8 +1349,8 @@ SELECTS_SPECIFIC = {
             "Micro-ramps",
             "Tag rampable hits (impact/word) for later 90–110% time-micro to sell emphasis.",
         ),
-    ],
-    "broll": [
+    ),
+    "broll": (
         _mp(
             5.0,
             "Orange",
@@ -1268,9 +1369,9 @@ SELECTS_SPECIFIC = {
             "Cutaway purpose",
             "Each B-roll pick should illustrate a lyric/idea or hide an A-roll cut.",
         ),
-    ],
+    ),
     # ——— Fashion
-    "fashion_look": [
+    "fashion_look": (
         _mp(
             5.0,
             "Red",
@@ -1289,9 +1390,9 @@ SELECTS_SPECIFIC = {
             "Color/texture continuity",
             "Note lighting shifts; tag candidates for thumbnail/carousel.",
         ),
-    ],
+    ),
     # ——— Talking Head
-    "th_aroll": [
+    "th_aroll": (
         _mp(
             5.0,
             "Red",
@@ -1310,8 +1411,8 @@ SELECTS_SPECIFIC = {
             "Caption sync",
             "Keep phrase boundaries clean for line breaks; avoid mid-word cuts.",
         ),
-    ],
-    "th_broll": [
+    ),
+    "th_broll": (
         _mp(
             5.0,
             "Orange",
@@ -1324,9 +1425,9 @@ SELECTS_SPECIFIC = {
             "Readability",
             "Avoid busy frames behind captions; prefer negative space or shallow DOF.",
         ),
-    ],
+    ),
     # ——— Day in the Life
-    "dil_generic": [
+    "dil_generic": (
         _mp(
             5.0,
             "Red",
@@ -1339,8 +1440,8 @@ SELECTS_SPECIFIC = {
             "Entrances/Exits",
             "Favor shots with natural in/out motion for seamless chaining.",
         ),
-    ],
-    "dil_commute": [
+    ),
+    "dil_commute": (
         _mp(
             5.0,
             "Orange",
@@ -1353,8 +1454,8 @@ SELECTS_SPECIFIC = {
             "Landmarks",
             "Tag 1–2 location wides for context; hold for 0.5–1.0s longer.",
         ),
-    ],
-    "dil_coffee": [
+    ),
+    "dil_coffee": (
         _mp(
             5.0,
             "Pink",
@@ -1367,9 +1468,9 @@ SELECTS_SPECIFIC = {
             "Loop beats",
             "Pick a looping action (stir, sip, door swing) for intros/outros.",
         ),
-    ],
+    ),
     # ——— Cook-Ups
-    "cook_overhead": [
+    "cook_overhead": (
         _mp(
             5.0,
             "Red",
@@ -1382,8 +1483,8 @@ SELECTS_SPECIFIC = {
             "UI context",
             "Grab short UI pans for key/plugin; make sure values are legible.",
         ),
-    ],
-    "cook_front": [
+    ),
+    "cook_front": (
         _mp(
             5.0,
             "Orange",
@@ -1396,8 +1497,8 @@ SELECTS_SPECIFIC = {
             "Reveal moments",
             "Pick sequences that set up/pay off arrangement changes.",
         ),
-    ],
-    "cook_foley": [
+    ),
+    "cook_foley": (
         _mp(
             5.0,
             "Cyan",
@@ -1410,9 +1511,9 @@ SELECTS_SPECIFIC = {
             "Variety",
             "Gather a library: short/long whooshes, reverse, button, cloth, hands.",
         ),
-    ],
+    ),
     # ——— Stringout (generic fallback)
-    "stringout_generic": [
+    "stringout_generic": (
         _mp(
             5.0,
             "Red",
@@ -1431,13 +1532,13 @@ SELECTS_SPECIFIC = {
             "Markers to beats",
             "Range-mark final beats to guide transitions and graphics later.",
         ),
-    ],
+    ),
 }
 
 
 PRINCIPLE_PACKS = {
     # ③ Scenes & Segments — narrative rhythm + attention refresh
-    "scenes_segments": [
+    "scenes_segments": (
         _mp(
             0.0,
             "Purple",
@@ -1458,12 +1559,10 @@ PRINCIPLE_PACKS = {
             "Loop seam awareness",
             "Plan an end frame that re-enters cleanly if the video loops on social.",
         ),
-        _mp(
-            299.0, "Blue", "⏱ 5min anchor", "Timeline duration marker (auto-generated)"
-        ),
-    ],
+        _ANCHOR_5MIN_NOTED,
+    ),
     # ④ ShotFX — beauty/compositing/cleanup without overworking the shot
-    "shotfx": [
+    "shotfx": (
         _mp(
             0.0,
             "Purple",
@@ -1482,14 +1581,12 @@ PRINCIPLE_PACKS = {
             2.0,
             "Pink",
             "Look exploration",
-            "Try one alternate 'beauty vs grit' treatment for options later.",
-        ),
-        _mp(
-            299.0, "Blue", "⏱ 5min anchor", "Timeline duration marker (auto-generated)"
+            "Try one alternate 'beauty vs grit' treatment for options later.",
         ),
-    ],
+        _ANCHOR_5MIN_NOTED,
+    ),
     # ⑤ Talking Head — clarity + retention psychology
-    "talking_head": [
+    "talking_head": (
         _mp(
             0.0,
             "Purple",
@@ -1510,12 +1607,10 @@ PRINCIPLE_PACKS = {
             "Pacing & captions",
             "Keep line breaks on phrase boundaries; punch keywords with subtle zoom/audio emphasis.",
         ),
-        _mp(
-            299.0, "Blue", "⏱ 5min anchor", "Timeline duration marker (auto-generated)"
-        ),
-    ],
+        _ANCHOR_5MIN_NOTED,
+    ),
     # ⑥ Fashion — silhouette, detail storytelling, motion aura
-    "fashion": [
+    "fashion": (
         _mp(
             0.0,
             "Purple",
@@ -1536,12 +1631,10 @@ PRINCIPLE_PACKS = {
             "Thumbnail candidates",
             "Flag strong stills for covers/carousels later.",
         ),
-        _mp(
-            299.0, "Blue", "⏱ 5min anchor", "Timeline duration marker (auto-generated)"
-        ),
-    ],
+        _ANCHOR_5MIN_NOTED,
+    ),
     # ⑦ Day in the Life — micro-story structure
-    "day_in_the_life": [
+    "day_in_the_life": (
         _mp(
             0.0,
             "Purple",
@@ -1568,12 +1661,10 @@ PRINCIPLE_PACKS = {
             "Cycle closure",
             "Leave a resolved beat that can loop if needed.",
         ),
-        _mp(
-            299.0, "Blue", "⏱ 5min anchor", "Timeline duration marker (auto-generated)"
-        ),
-    ],
+        _ANCHOR_5MIN_NOTED,
+    ),
     # ⑧ Cook-Ups — show progress & payoff without getting lost
-    "cook_ups": [
+    "cook_ups": (
         _mp(
             0.0,
             "Purple",
@@ -1599,12 +1690,25 @@ PRINCIPLE_PACKS = {
             "Vibe spike",
             "Create a small peak (camera move, slow-mo, quick cut burst).",
         ),
-        _mp(
-            299.0, "Blue", "⏱ 5min anchor", "Timeline duration marker (auto-generated)"
-        ),
-    ],
+        _ANCHOR_5MIN_NOTED,
+    ),
 }
 
+# Each pack is authored in time order; base + variant combos are not, and get sorted
+# by _butt_join_markers.
+for _pack in (
+    SELECTS_BASE,
+    *SHOTFX_SPECIFIC.values(),
+    *SELECTS_SPECIFIC.values(),
+    *PRINCIPLE_PACKS.values(),
+):
+    _check_time_sorted(_pack)
+del _pack
+
+# Base + variant packs, concatenated once; every timeline of a variant shares the tuple
+_SELECTS_COMBINED = {k: SELECTS_BASE + v for k, v in SELECTS_SPECIFIC.items()}
+_SHOTFX_COMBINED = {k: PRINCIPLE_PACKS["shotfx"] + v for k, v in SHOTFX_SPECIFIC.items()}
+
 
 # ═══════════════════════════════════════════════════════════════════════════════════════════════
 # v4.7.1 Enhancement: 100% Enrichment + Marker Lints
@@ -1716,6 +1820,8 @@ def enrich_marker_set_for(markers, lane=None, tier=None):
         List of enriched marker dicts (modifies in place)
     """
     for m in markers:
+        if not isinstance(m, dict):
+            continue  # Marker templates are immutable; they carry their notes already
         title = m.get("name", "")
         note = m.get("note", "")
 
@@ -1792,14 +1898,14 @@ def _monkey_patch_add_markers():
 
     _original_add_markers = globals()["add_markers_to_timeline_if_empty"]
 
-    def _wrapped(tl, fps_str, markers, force=False):
+    def _wrapped(tl, fps_str, markers, force=False, existing=None):
         # Enrich markers before adding (extract lane/tier from timeline name)
         tl_name = tl.GetName() if hasattr(tl, "GetName") else ""
         lane, tier = _lane_tier_from_title(tl_name)
         enrich_marker_set_for(markers, lane, tier)
 
         # Call original function
-        return _original_add_markers(tl, fps_str, markers, force)
+        return _original_add_markers(tl, fps_str, markers, force, existing)
 
     globals()["add_markers_to_timeline_if_empty"] = _wrapped
 
@@ -2309,139 +2415,193 @@ PACING_S = {
 }
 
 
+_MASTER_LANE_RULES = (
+    ("money", ("money master",), ()),
+    ("mv", ("mv master",), ()),
+    ("fashion", ("fashion master",), ()),
+    ("talking", ("th master",), ()),
+    ("dil", ("dil master",), ()),
+    ("cook", ("cook-up master",), ()),
+)
+# For non-master timelines, infer lane from pillar bucket (title prefix)
+_PILLAR_PREFIX_LANE_RULES = (
+    ("mv", (), ("segment -",)),
+    ("talking", (), ("interview -",)),
+    ("fashion", (), ("look -",)),
+    ("dil", (), ("chapter -",)),
+    ("cook", (), ("section -",)),
+)
+
+
+# Tier tags probed in master titles, shortest first; anything else is the 30s tier
+_SHORT_TIERS = ("12s", "22s")
+
+
 def _lane_tier_from_title(title: str):
     """Extract lane and tier from timeline title."""
-    t = str(title or "").lower()
-    if "money master" in t:
-        return "money", ("12s" if "12s" in t else "22s" if "22s" in t else "30s")
-    if "mv master" in t:
-        return "mv", ("12s" if "12s" in t else "22s" if "22s" in t else "30s")
-    if "fashion master" in t:
-        return "fashion", ("12s" if "12s" in t else "22s" if "22s" in t else "30s")
-    if "th master" in t:
-        return "talking", ("12s" if "12s" in t else "22s" if "22s" in t else "30s")
-    if "dil master" in t:
-        return "dil", ("12s" if "12s" in t else "22s" if "22s" in t else "30s")
-    if "cook-up master" in t:
-        return "cook", ("12s" if "12s" in t else "22s" if "22s" in t else "30s")
-    # For non-master timelines, infer lane from pillar bucket
-    nt = t.replace("—", "-")
-    if nt.startswith("segment -"):
-        return "mv", "30s"
-    if nt.startswith("interview -"):
-        return "talking", "30s"
-    if nt.startswith("look -"):
-        return "fashion", "30s"
-    if nt.startswith("chapter -"):
-        return "dil", "30s"
-    if nt.startswith("section -"):
-        return "cook", "30s"
+    t = _norm_title(title)
+    lane = _match_title_rules(t, _MASTER_LANE_RULES)
+    if lane:
+        return lane, next((tier for tier in _SHORT_TIERS if tier in t), "30s")
+    lane = _match_title_rules(t, _PILLAR_PREFIX_LANE_RULES)
+    if lane:
+        return lane, "30s"
     return None, None
 
 
+def _with_cut_tip(notes, tip):
+    base = notes.rstrip()
+    return f"{base}\n— Cuts: {tip}" if base else f"Cuts: {tip}"
+
+
+def _apply_cut_tips(markers, tips):
+    if tips.keys().isdisjoint(m.name for m in markers):
+        return markers
+    # markers without a tip pass through as the same (pooled) object
+    get = tips.get
+    return [
+        m._replace(notes=_with_cut_tip(m.notes, tip)) if (tip := get(m.name)) else m
+        for m in markers
+    ]
+
+
+# (lane, tier) -> enrichment function with that tier's PACING_S tips bound in, built once
+# (PACING_S stays the editable source)
+_TIP_APPLIERS = {
+    (lane, tier): functools.partial(_apply_cut_tips, tips=sections)
+    for lane, tiers in PACING_S.items()
+    for tier, sections in tiers.items()
+    if sections
+}
+
+
 def _enrich_marker_notes(markers, lane, tier):
     """Add seconds-based cut guidance into each marker's notes."""
-    if not markers or not lane or not tier:
+    applier = _TIP_APPLIERS.get((lane, tier))
+    if not markers or applier is None:
         return markers
-    rules = PACING_S.get(lane, {}).get(tier, {})
-    out = []
-    for m in markers:
-        m2 = dict(m)
-        tip = rules.get(m2.get("name", ""), "")
-        if tip:
-            base = m2.get("notes", "").rstrip()
-            if base:
-                m2["notes"] = f"{base}\n— Cuts: {tip}"
-            else:
-                m2["notes"] = f"Cuts: {tip}"
-        out.append(m2)
-    return out
+    return applier(markers)
+
+
+# (lane, pillar-name substring, title prefixes), first hit wins
+_LANE_INFER_RULES = (
+    ("mv", "music-video", ("segment -", "mv master")),
+    ("fashion", "fashion", ("look -", "fashion master")),
+    ("talking", "talking head", ("interview -", "th master")),
+    ("dil", "day in the life", ("chapter -", "dil master")),
+    ("cook", "cook-ups", ("section -", "cook-up master")),
+)
+
+
+@functools.cache
+def _pillar_lane_rules(pillar_name):
+    """(rules still decided by title, fallback lane) for a pillar; once per pillar."""
+    p = (pillar_name or "").lower()
+    for i, (lane, pillar_needle, _prefixes) in enumerate(_LANE_INFER_RULES):
+        if pillar_needle in p:
+            # rules after the pillar's own lane can never win over it
+            return _LANE_INFER_RULES[:i], lane
+    return _LANE_INFER_RULES, "money"  # money pillar / money master / safe default
 
 
 def _infer_lane_from_pillar_or_title(pillar_name: str, title: str) -> str:
     """Infer the lane (money/mv/fashion/talking/dil/cook) from pillar or title."""
-    p = (pillar_name or "").lower()
-    t = (title or "").lower()
-    if "music-video" in p or t.startswith("segment —") or t.startswith("mv master"):
-        return "mv"
-    if "fashion" in p or t.startswith("look —") or t.startswith("fashion master"):
-        return "fashion"
-    if "talking head" in p or t.startswith("interview —") or t.startswith("th master"):
-        return "talking"
-    if (
-        "day in the life" in p
-        or t.startswith("chapter —")
-        or t.startswith("dil master")
-    ):
-        return "dil"
-    if "cook-ups" in p or t.startswith("section —") or t.startswith("cook-up master"):
-        return "cook"
-    if "money" in p or "money master" in t:
-        return "money"
-    return "money"  # safe default
+    rules, lane = _pillar_lane_rules(pillar_name)
+    t = _norm_title(title)
+    for rule_lane, _needle, title_prefixes in rules:
+        # one C-level startswith over both prefixes per lane
+        if t.startswith(title_prefixes):
+            return rule_lane
+    return lane
 
 
-# Map timeline title to a principle pack (skip masters).
+_PRINCIPLE_MASTER_SUBSTRINGS = (" money master", " master -")
+_PRINCIPLE_MASTER_PREFIXES = (
+    "money master",
+    "mv master",
+    "th master",
+    "fashion master",
+    "dil master",
+    "cook-up master",
+)
+
+
+def _selects_pack(t):
+    # base tips + the variant-specific ones, or just the base tips
+    return _SELECTS_COMBINED.get(_selects_variant_for_title(t), SELECTS_BASE)
+
+
+def _shotfx_pack(t):
+    # base principles + the variant-specific tips, or just the base
+    return _SHOTFX_COMBINED.get(_shotfx_variant_for_title(t), PRINCIPLE_PACKS["shotfx"])
+
+
+def _principle_pack(key):
+    return lambda t: PRINCIPLE_PACKS[key]
+
+
+# (substrings, handler), scanned in order with contains matching; first hit wins.
+# Selects & Stringouts go FIRST to avoid collision with keywords like "look".
+_PRINCIPLE_DISPATCH = (
+    (("selects", "stringout"), _selects_pack),
+    (("shotfx", "shot fx"), _shotfx_pack),
+    (("segment",), _principle_pack("scenes_segments")),
+    (("interview",), _principle_pack("talking_head")),
+    (("look",), _principle_pack("fashion")),
+    (("chapter",), _principle_pack("day_in_the_life")),
+    (("section",), _principle_pack("cook_ups")),
+)
+
+
+# Map timeline title to a principle pack (skip masters). Packs are immutable tuples, so
+# results are cached per title and shared.
+@functools.lru_cache(maxsize=1024)
 def get_principle_markers_for_title(title):
-    t = (title or "").lower().replace("—", "-").replace("–", "-")
+    t = _norm_title(title)
 
     # Exclude any master timelines
-    if (
-        (" money master" in t or t.startswith("money master"))
-        or (" master -" in t or t.startswith("mv master"))
-        or t.startswith("th master")
-        or t.startswith("fashion master")
-        or t.startswith("dil master")
-        or t.startswith("cook-up master")
+    if t.startswith(_PRINCIPLE_MASTER_PREFIXES) or any(
+        needle in t for needle in _PRINCIPLE_MASTER_SUBSTRINGS
     ):
-        return []
-
-    # Use contains matching with flexible patterns
-    # Selects & Stringouts — check FIRST to avoid collision with keywords like "look"
-    if "selects" in t or "stringout" in t:
-        base = SELECTS_BASE
-        var_key = _selects_variant_for_title(t)
-        if var_key and var_key in SELECTS_SPECIFIC:
-            return base + SELECTS_SPECIFIC[var_key]
-        # fallback: just the base tips
-        return base
-
-    # ShotFX - with variant-specific tips
-    if ("shotfx" in t) or ("shot fx" in t):
-        base = PRINCIPLE_PACKS["shotfx"]
-        var_key = _shotfx_variant_for_title(t)
-        if var_key and var_key in SHOTFX_SPECIFIC:
-            # Combine base principles + the variant-specific tips
-            return base + SHOTFX_SPECIFIC[var_key]
-        return base
-    if "segment" in t:
-        return PRINCIPLE_PACKS["scenes_segments"]
-    if "interview" in t:
-        return PRINCIPLE_PACKS["talking_head"]
-    if "look" in t:
-        return PRINCIPLE_PACKS["fashion"]
-    if "chapter" in t:
-        return PRINCIPLE_PACKS["day_in_the_life"]
-    if "section" in t:
-        return PRINCIPLE_PACKS["cook_ups"]
+        return ()
+
+    for needles, handler in _PRINCIPLE_DISPATCH:
+        if any(needle in t for needle in needles):
+            return handler(t)
 
     # Leave sync and other utility timelines untagged by default
-    return []
+    return ()
 
 
 # ───────────────────────── Data / Stats helpers ─────────────────────────
-def get_folder_path(folder):
-    names = []
-    cur = folder
-    for _ in range(10):
-        try:
-            names.append(cur.GetName())
-            cur = cur.GetParent()
-            if not cur:
-                break
-        except Exception:
-            break
-    return " / ".join(reversed(names))
+# Folder.GetUniqueId() -> "Master / A / B"; folders are only added, never renamed/moved
+_FOLDER_PATHS = {}
+
+
+def get_folder_path(folder, _depth=10):
+    try:
+        key = folder.GetUniqueId()
+    except Exception:
+        key = None
+    if key and key in _FOLDER_PATHS:
+        return _FOLDER_PATHS[key]
+    try:
+        name = folder.GetName()
+    except Exception:
+        return ""
+    try:
+        parent = folder.GetParent() if _depth > 1 else None
+    except Exception:
+        parent = None
+    # recurse through the (cached) parent path instead of re-walking to the root
+    parent_path = get_folder_path(parent, _depth - 1) if parent else ""
+    path = f"{parent_path} / {name}" if parent_path else name
+    if key:
+        _FOLDER_PATHS[key] = path
+    return path
+
+
+_MAX_RECORDED_ERRORS = 10_000
 
 
 class BuildStats:
@@ -2452,11 +2612,14 @@ class BuildStats:
         self.timelines_failed = 0
         self.timelines_skipped = 0
         self.tracks_created = 0
-        self.errors = []
+        # raw (op, err) pairs, formatted only in summary(); bounded for runaway builds
+        self.errors = deque(maxlen=_MAX_RECORDED_ERRORS)
+        self.error_count = 0
         self.start_time = datetime.datetime.now()
 
     def log_error(self, op, err):
-        self.errors.append(f"{op}: {err}")
+        self.error_count += 1
+        self.errors.append((op, err))
 
     def summary(self):
         d = datetime.datetime.now() - self.start_time
@@ -2468,13 +2631,28 @@ class BuildStats:
             "timelines_failed": self.timelines_failed,
             "timelines_skipped": self.timelines_skipped,
             "tracks_created": self.tracks_created,
-            "error_count": len(self.errors),
-            "errors": self.errors,
+            "error_count": self.error_count,
+            "errors": [f"{op}: {err}" for op, err in self.errors],
         }
 
 
 # ───────────────────────── Folder helpers ─────────────────────────
+# Which subfolder accessor this Resolve build exposes (and whether it returns a dict),
+# learned from the first folder that answers; later calls skip the probing.
+_SUBFOLDER_ACCESSOR = None
+_SUBFOLDER_RETURNS_DICT = False
+
+
 def _iter_subfolders(folder):
+    global _SUBFOLDER_ACCESSOR, _SUBFOLDER_RETURNS_DICT
+    if _SUBFOLDER_ACCESSOR:
+        try:
+            res = getattr(folder, _SUBFOLDER_ACCESSOR)()
+        except Exception:
+            return []
+        if not res:
+            return []
+        return list(res.values()) if _SUBFOLDER_RETURNS_DICT else res
     for accessor in ("GetSubFolders", "GetSubFolderList"):
         f = getattr(folder, accessor, None)
         if not f:
@@ -2482,23 +2660,36 @@ def _iter_subfolders(folder):
         try:
             res = f()
             if isinstance(res, dict):
+                _SUBFOLDER_ACCESSOR, _SUBFOLDER_RETURNS_DICT = accessor, True
                 return list(res.values())
             if isinstance(res, list):
+                _SUBFOLDER_ACCESSOR, _SUBFOLDER_RETURNS_DICT = accessor, False
                 return res
         except Exception:
             pass
     return []
 
 
-def get_or_create_folder(mp, parent, name, stats):
+def _find_subfolder(parent, name):
+    # one sibling whose GetName() raises must not end the scan (a miss creates a duplicate bin)
     for sub in _iter_subfolders(parent):
+        get_name = getattr(sub, "GetName", None)
+        if get_name is None:
+            continue
         try:
-            if sub.GetName() == name:
-                log.info("  📂 Found: %s (under %s)", name, get_folder_path(parent))
-                stats.folders_found += 1
+            if get_name() == name:
                 return sub
         except Exception:
-            pass
+            continue
+    return None
+
+
+def get_or_create_folder(mp, parent, name, stats):
+    sub = _find_subfolder(parent, name)
+    if sub is not None:
+        log.info("  📂 Found: %s (under %s)", name, get_folder_path(parent))
+        stats.folders_found += 1
+        return sub
     folder = None
     try:
         folder = mp.AddSubFolder(parent, name)
@@ -2533,30 +2724,35 @@ def get_or_create_folder(mp, parent, name, stats):
 
 
 # ───────────────────────── Timeline helpers ─────────────────────────
-def timeline_exists(project, name):
-    try:
-        tls = project.GetTimelines()
-        if isinstance(tls, list):
-            for tl in tls:
-                try:
-                    if tl and tl.GetName() == name:
-                        return True
-                except Exception:
-                    pass
-    except Exception:
-        pass
-    try:
-        count = int(project.GetTimelineCount())
-        for i in range(1, count + 1):
-            try:
+# project -> {timeline name: timeline}, built by one index scan and kept current as this
+# module creates timelines (the builder never renames or deletes them). Reset per main().
+_TIMELINE_SNAPSHOTS = {}
+
+
+def _project_key(project):
+    with suppress(Exception):
+        uid = project.GetUniqueId()
+        if uid:
+            return uid
+    return id(project)
+
+
+def _snapshot_timelines(project):
+    key = _project_key(project)
+    snap = _TIMELINE_SNAPSHOTS.get(key)
+    if snap is None:
+        snap = {}
+        with suppress(Exception):
+            for i in range(1, int(project.GetTimelineCount() or 0) + 1):
                 tl = project.GetTimelineByIndex(i)
-                if tl and tl.GetName() == name:
-                    return True
-            except Exception:
-                continue
-    except Exception:
-        pass
-    return False
+                if tl:
+                    snap.setdefault(tl.GetName(), tl)  # first by index wins
+        _TIMELINE_SNAPSHOTS[key] = snap
+    return snap
+
+
+def timeline_exists(project, name):
+    return name in _snapshot_timelines(project)
 
 
 def ensure_tracks_named(
@@ -2570,8 +2766,7 @@ def ensure_tracks_named(
         have = int(tl.GetTrackCount(kind))
     except Exception:
         have = 0
-    need = len(target) - have
-    for _ in range(max(0, need)):
+    for _ in range(len(target) - have):
         try:
             tl.AddTrack(kind)
             if stats:
@@ -2580,15 +2775,11 @@ def ensure_tracks_named(
             log.error("❌ Failed to add %s track: %s", kind, e)
             if stats:
                 stats.log_error(f"Track creation: {kind}", str(e))
-    # Name tracks
-    if kind == "video":
-        for i, label in enumerate(target, 1):
-            with suppress(Exception):
-                tl.SetTrackName("video", i, label)
-    else:
-        for i, label in enumerate(target, 1):
-            with suppress(Exception):
-                tl.SetTrackName("audio", i, label)
+    # Name tracks (one failed rename must not leave the remaining tracks unnamed)
+    for i, label in enumerate(target, 1):
+        with suppress(Exception):
+            tl.SetTrackName(kind, i, label)
+    if kind != "video":
         # subtitle once
         try:
             subcnt = int(tl.GetTrackCount("subtitle"))
@@ -2617,29 +2808,44 @@ def _sec_to_frames(sec, fps_float):
     return int(round(sec * fps_float))
 
 
+@functools.cache
+def _marker_frames(m, fps_float):
+    """(frame, dur_frames) for a Marker; shared templates convert once per fps."""
+    # CRITICAL: Resolve 20.2 requires duration >= 1, cannot be 0
+    return _sec_to_frames(m.t, fps_float), max(1, _sec_to_frames(m.dur, fps_float))
+
+
 def _butt_join_markers(markers, fps_str):
     """Ensure consecutive duration markers visually abut (extend earlier by 1 frame if needed)."""
+    if not markers:
+        return markers
+    return list(_butt_join_cached(tuple(markers), fps_str))
+
+
+@functools.cache
+def _butt_join_cached(markers, fps_str):
+    # One linear pass per distinct (pack, fps); packs repeat across lanes and re-runs.
     try:
         fps = float(fps_str)
     except Exception:
         fps = 29.97
-    if not markers:
-        return markers
-    # Work on a copy sorted by time
-    ms = sorted((dict(m) for m in markers), key=lambda x: x.get("t", 0.0))
-    for i in range(len(ms) - 1):
-        cur, nxt = ms[i], ms[i + 1]
-        cur_t = float(cur.get("t", 0.0))
-        cur_d = float(cur.get("dur", 0.0))
-        nxt_t = float(nxt.get("t", 0.0))
-        if cur_d <= 0.0:
-            continue
-        # desired end = cur_t + cur_d
-        gap = nxt_t - (cur_t + cur_d)
-        if gap > 0:
-            # stretch current by min(gap, 1 frame) to close hairline gap without overlap
-            cur["dur"] = cur_d + min(gap, 1.0 / fps)
-    return ms
+    # Sorted by time (single packs already are; base + variant combos aren't)
+    ms = markers if _is_time_sorted(markers) else tuple(sorted(markers, key=_T_KEY))
+    if len(ms) < 2:
+        return ms
+    one_frame = 1.0 / fps
+    # One pass over adjacent pairs: gap = next start - (cur start + cur dur). A duration
+    # marker followed by a gap is stretched by min(gap, 1 frame) to close the hairline
+    # without overlap; everything else is passed through as the original object.
+    return (
+        *(
+            cur._replace(dur=cur.dur + min(gap, one_frame))
+            if cur.dur > 0.0 and (gap := nxt.t - (cur.t + cur.dur)) > 0
+            else cur
+            for cur, nxt in zip(ms[:-1], ms[1:], strict=True)
+        ),
+        ms[-1],
+    )
 
 
 # ───────────────────────── Anchor suppression / exact-second retime ─────────────────────────
@@ -2869,7 +3075,7 @@ def _pad_last_macro_to_end(tl, fps_float: float, tier_end_sec: float = 30.0) ->
     if not items:
         return False
 
-    items.sort(key=lambda x: x[0])
+    items.sort(key=itemgetter(0))
 
     last_macro = None
     for fr, name, color, note, dur in reversed(items):
@@ -3252,84 +3458,132 @@ def ensure_min_duration(dur_frames):
     return max(1, int(dur_frames or 1))
 
 
+# AddMarker signature this Resolve build accepts: 6 args (with customData) or the older
+# 5. Learned from the first call that answers; later calls skip the failing form.
+_ADDMARKER_ARGC = None
+
+
+def _add_marker_call(tl, frame, color, name, note, dur_frames):
+    global _ADDMARKER_ARGC
+    if _ADDMARKER_ARGC == 6:
+        return tl.AddMarker(frame, color, name, note, dur_frames, "")
+    if _ADDMARKER_ARGC == 5:
+        return tl.AddMarker(frame, color, name, note, dur_frames)
+    try:
+        ok = tl.AddMarker(frame, color, name, note, dur_frames, "")
+        _ADDMARKER_ARGC = 6
+        return ok
+    except Exception as e:
+        log.debug("      ⚠️  AddMarker exception (6-arg): %s", e)
+    ok = tl.AddMarker(frame, color, name, note, dur_frames)
+    _ADDMARKER_ARGC = 5
+    return ok
+
+
 def _add_marker_safe(tl, frame, color, name, note, dur_frames):
     # CRITICAL: Ensure duration >= 1 for Resolve 20.2+
     dur_frames = ensure_min_duration(dur_frames)
 
     try:
-        ok = tl.AddMarker(frame, color, name, note, dur_frames, "")
-        if ok:
+        if _add_marker_call(tl, frame, color, name, note, dur_frames):
             return True
-        log.debug(
-            f"      ⚠️  AddMarker failed (6-arg): frame={frame}, color={color}, name={name}"
-        )
+        log.debug("      ⚠️  AddMarker failed: frame=%s, color=%s, name=%s", frame, color, name)
         fb = _COLOR_FALLBACK.get(color)
-        if fb:
-            ok2 = tl.AddMarker(frame, fb, name, note, dur_frames, "")
-            if ok2:
-                log.debug(f"      ✓ AddMarker succeeded with fallback color: {fb}")
-                return True
+        if fb and _add_marker_call(tl, frame, fb, name, note, dur_frames):
+            log.debug("      ✓ AddMarker succeeded with fallback color: %s", fb)
+            return True
     except Exception as e:
-        log.debug(f"      ⚠️  AddMarker exception (6-arg): {e}")
-        try:
-            ok3 = tl.AddMarker(frame, color, name, note, dur_frames)
-            if ok3:
-                log.debug("      ✓ AddMarker succeeded (5-arg)")
-                return True
-            log.debug(
-                f"      ⚠️  AddMarker failed (5-arg): frame={frame}, color={color}"
-            )
-            fb = _COLOR_FALLBACK.get(color)
-            if fb:
-                ok4 = tl.AddMarker(frame, fb, name, note, dur_frames)
-                if ok4:
-                    log.debug(
-                        f"      ✓ AddMarker succeeded (5-arg) with fallback: {fb}"
-                    )
-                    return True
-        except Exception as e2:
-            log.debug(f"      ⚠️  AddMarker exception (5-arg): {e2}")
-    log.warning(f"      ❌ ALL AddMarker attempts failed for: {name} @ frame {frame}")
+        log.debug("      ⚠️  AddMarker exception: %s", e)
+    log.warning("      ❌ ALL AddMarker attempts failed for: %s @ frame %s", name, frame)
     return False
 
 
-def _ensure_silence_asset(seconds=2.0, sr=48000, channels=2, bits=16):
-    """Create (once) a silent WAV we can append so AddMarker works on empty timelines."""
+@functools.cache
+def _assets_dir():
+    """Generated-asset folder next to the script, created on first use."""
     try:
         assets_dir = os.path.join(_script_dir(), "assets")
     except Exception:
         assets_dir = os.path.expanduser("~/tmp/dega_assets")
     os.makedirs(assets_dir, exist_ok=True)
-    wav_path = os.path.join(assets_dir, f"_dega_silence_{int(seconds*1000)}ms.wav")
+    return assets_dir
+
+
+@functools.cache
+def _ensure_silence_asset(seconds=2.0, sr=48000, channels=2, bits=16):
+    """Create (once) a silent WAV we can append so AddMarker works on empty timelines."""
+    # memoized: later fallbacks in the same session skip the makedirs/exists syscalls
+    wav_path = os.path.join(_assets_dir(), f"_dega_silence_{int(seconds*1000)}ms.wav")
     if not os.path.exists(wav_path):
-        nframes = int(sr * seconds)
-        with wave.open(wav_path, "wb") as wf:
-            wf.setnchannels(channels)
-            wf.setsampwidth(bits // 8)
-            wf.setframerate(sr)
-            silence = struct.pack("<h", 0)  # 16-bit little-endian zero
-            wf.writeframes(silence * nframes * channels)
+        # only needed the first time the asset is written; kept off the import path
+        import struct
+
+        block_align = channels * (bits // 8)
+        data_size = int(sr * seconds) * block_align
+        # canonical 44-byte PCM header: RIFF, "fmt " (16 bytes, format 1), "data"
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + data_size,
+            b"WAVE",
+            b"fmt ",
+            16,
+            1,
+            channels,
+            sr,
+            sr * block_align,
+            block_align,
+            bits,
+            b"data",
+            data_size,
+        )
+        # PCM silence is all zero bytes: header + one zero-filled buffer, one write
+        with open(wav_path, "wb") as f:
+            f.write(header + bytes(data_size))
     return wav_path
 
 
+# Timeline unique ids known to hold at least one item. Only positives are cached: the
+# builder never removes clips, so a timeline that had content still has it.
+_TIMELINES_WITH_ITEMS = set()
+
+
+def _timeline_has_items(tl):
+    for kind in ("video", "audio", "subtitle"):  # video first: likeliest to hold items
+        try:
+            tracks = int(tl.GetTrackCount(kind))
+        except Exception:
+            tracks = 0
+        for idx in range(1, tracks + 1):
+            try:
+                if tl.GetItemListInTrack(kind, idx):
+                    return True  # first non-empty track settles it
+            except Exception:
+                continue
+    return False
+
+
+def _set_current_timeline(project, tl):
+    """Make ``tl`` the current timeline unless it already is (each switch redraws the UI)."""
+    with suppress(Exception):
+        cur = project.GetCurrentTimeline()
+        if cur and cur.GetUniqueId() == tl.GetUniqueId():
+            return True
+    return bool(project.SetCurrentTimeline(tl))
+
+
 def ensure_timeline_nonempty_with_silence(mp, project, tl, seconds=2.0):
     """Append a tiny silent audio clip if timeline has no items, so markers can be added."""
-    # quick existence check: if any track has items, we're done
     try:
-        for kind in ("video", "audio", "subtitle"):
-            try:
-                tracks = int(tl.GetTrackCount(kind))
-            except Exception:
-                tracks = 0
-            for idx in range(1, tracks + 1):
-                try:
-                    items = tl.GetItemListInTrack(kind, idx)
-                except Exception:
-                    items = []
-                if items:
-                    return True
+        key = tl.GetUniqueId()
     except Exception:
-        pass
+        key = None
+    if key and key in _TIMELINES_WITH_ITEMS:
+        return True
+    if _timeline_has_items(tl):
+        if key:
+            _TIMELINES_WITH_ITEMS.add(key)
+        return True
 
     wav_path = _ensure_silence_asset(seconds=seconds)
     items = mp.ImportMedia([wav_path]) or []
@@ -3339,43 +3593,91 @@ def ensure_timeline_nonempty_with_silence(mp, project, tl, seconds=2.0):
         raise RuntimeError("ImportMedia returned no items")
 
     # Set timeline as current and append the silent clip
-    project.SetCurrentTimeline(tl)
-    ok = mp.AppendToTimeline([items[0]])
-    return bool(ok)
+    _set_current_timeline(project, tl)
+    ok = bool(mp.AppendToTimeline([items[0]]))
+    if ok and key:
+        _TIMELINES_WITH_ITEMS.add(key)
+    return ok
+
+
+# Whether this Resolve build exposes Timeline.GetMarkers(); learned on the first probe.
+_HAS_GET_MARKERS = None
 
 
 def _count_markers(tl):
-    # Resolve API has GetMarkers() on some builds; fall back if not present.
+    """Marker count on ``tl``; -1 when this build cannot tell (no/odd GetMarkers)."""
+    global _HAS_GET_MARKERS
+    if _HAS_GET_MARKERS is None:
+        _HAS_GET_MARKERS = hasattr(tl, "GetMarkers")
+    if not _HAS_GET_MARKERS:
+        return -1
     try:
         mk = tl.GetMarkers()
-        if isinstance(mk, dict):
-            return len(mk)
-        if isinstance(mk, list):
-            return len(mk)
-    except Exception:
-        pass
-    # If unknown, return 0 to allow seeding (safe: markers are harmless)
-    return 0
+    except Exception:  # IPC hiccup; the attribute itself is known to exist
+        return -1
+    if not mk:
+        return 0
+    return len(mk) if isinstance(mk, (dict, list)) else -1
+
+
+@functools.cache
+def _marker_apply_plan(markers, fps_float):
+    """(frame, color, name, notes, dur) per marker, in the order they are added."""
+    # Add markers in reverse-time order to keep Resolve happy with long durations
+    plan = []
+    # butt-joined packs arrive ascending; strictly ascending ones just need reversing
+    # (ties keep their input order under sorted(reverse=True), so those still sort)
+    if all(a.t < b.t for a, b in zip(markers[:-1], markers[1:], strict=True)):
+        ordered = reversed(markers)
+    else:
+        ordered = sorted(markers, key=_T_KEY, reverse=True)
+    for m in ordered:
+        frame, dur = _marker_frames(m, fps_float)
+        color = _MARKER_COLOR_RESOLVED.get(m.color, "Red")
+        plan.append((frame, color, m.name, m.notes, dur))
+    return tuple(plan)
+
+
+@functools.cache
+def _seedable_markers(markers):
+    """Template markers minus far-future anchors and QC placeholders, once per template."""
+    # Silent-clip seed assist covers duration, so anchors are never seeded
+    return tuple(
+        m
+        for m in markers
+        if not _ANCHOR_NAME_PAT.search(m.name) and not _QC_MARKER_PAT.search(m.name)
+    )
+
+
+def bulk_add_markers(tl, markers, fps_float):
+    """Add a whole marker template to ``tl``; returns the number of markers added.
+
+    Frames, durations and colors are resolved once per distinct (template, fps) into
+    a cached plan; the loop below only dispatches. Resolve has no batch marker API,
+    so each marker is still one AddMarker call.
+    """
+    added = 0
+    for frame, color, name, notes, dur in _marker_apply_plan(tuple(markers), fps_float):
+        if _add_marker_safe(tl, frame, color, name, notes, dur):
+            added += 1
+    return added
 
 
-def add_markers_to_timeline_if_empty(tl, fps_str, markers, force=False):
+def add_markers_to_timeline_if_empty(tl, fps_str, markers, force=False, existing=None):
+    # ``existing``: marker count the caller already probed (saves a GetMarkers round-trip)
     try:
         fps_float = float(fps_str)
     except Exception:
         fps_float = 29.97
-    existing = _count_markers(tl)
-    if existing > 0 and not force:
-        log.info("   ↻ Markers present (%d) — skipping re-seed", existing)
-        return 0
+    if not force:
+        # the count only gates the skip, so forced re-seeds never probe
+        if existing is None:
+            existing = _count_markers(tl)
+        if existing > 0:
+            log.info("   ↻ Markers present (%d) — skipping re-seed", existing)
+            return 0
 
-    # Filter out far-future anchor markers; silent-clip seed assist covers duration
-    candidate_markers = markers or []
-    cleaned_markers = [
-        m
-        for m in candidate_markers
-        if not _ANCHOR_NAME_PAT.search(m.get("name") or "")
-        and not _QC_MARKER_PAT.search(m.get("name") or "")
-    ]
+    cleaned_markers = _seedable_markers(tuple(markers or ()))
 
     marker_count = len(cleaned_markers)
     if marker_count == 0:
@@ -3384,21 +3686,7 @@ def add_markers_to_timeline_if_empty(tl, fps_str, markers, force=False):
 
     log.info("   🏷️  Adding %d principle markers to: %s", marker_count, tl.GetName())
 
-    # Add markers in reverse-time order to keep Resolve happy with long durations
-    sorted_markers = sorted(cleaned_markers, key=lambda m: m["t"], reverse=True)
-
-    added = 0
-    for m in sorted_markers:
-        frame = _sec_to_frames(m["t"], fps_float)
-        dur = _sec_to_frames(m.get("dur", 0.0), fps_float)
-        # CRITICAL: Resolve 20.2 requires duration >= 1, cannot be 0
-        if dur < 1:
-            dur = 1
-        color = m["color"]
-        if color not in _SUPPORTED_MARKER_COLORS:
-            color = _COLOR_FALLBACK.get(color, "Red")
-        if _add_marker_safe(tl, frame, color, m["name"], m.get("notes", ""), dur):
-            added += 1
+    added = bulk_add_markers(tl, cleaned_markers, fps_float)
 
     if added == 0 and marker_count > 0:
         log.warning(
@@ -3443,6 +3731,23 @@ def restore_project_defaults(project, prev):
             project.SetSetting(k, v)
 
 
+# Project settings saved by the first timeline a run creates, per project. The build
+# values are applied once and restored once by main() instead of around every timeline.
+_HELD_PROJECT_DEFAULTS = {}
+
+
+def _hold_project_defaults(project, w, h, fps):
+    key = _project_key(project)
+    if key not in _HELD_PROJECT_DEFAULTS:
+        _HELD_PROJECT_DEFAULTS[key] = (project, set_project_defaults(project, w, h, fps))
+
+
+def _release_project_defaults():
+    for project, prev in _HELD_PROJECT_DEFAULTS.values():
+        restore_project_defaults(project, prev)
+    _HELD_PROJECT_DEFAULTS.clear()
+
+
 def create_vertical_timeline(
     mp, project, folder, title, w, h, fps, stats, markers=None
 ):
@@ -3450,8 +3755,8 @@ def create_vertical_timeline(
         stats.timelines_failed += 1
         stats.log_error(f"Timeline creation: {title}", "No target folder")
         return None
-    log.info(f"🎬 Creating timeline: {title}")
-    prev = set_project_defaults(project, w, h, fps)
+    log.info("🎬 Creating timeline: %s", title)
+    _hold_project_defaults(project, w, h, fps)
     safe_set_current_folder(mp, folder)
     try:
         tl = mp.CreateEmptyTimeline(title)
@@ -3460,32 +3765,31 @@ def create_vertical_timeline(
             stats.log_error(
                 f"Timeline creation: {title}", "CreateEmptyTimeline returned None"
             )
-            restore_project_defaults(project, prev)
             return None
     except Exception as e:
         stats.timelines_failed += 1
         stats.log_error(f"Timeline creation: {title}", str(e))
-        restore_project_defaults(project, prev)
         return None
-    restore_project_defaults(project, prev)
+    _snapshot_timelines(project).setdefault(title, tl)
     try:
         ensure_tracks_named(
             tl, "video", names_top_to_bottom=VIDEO_TRACKS_TOP_TO_BOTTOM, stats=stats
         )
         ensure_tracks_named(tl, "audio", names_left_to_right=AUDIO_TRACKS, stats=stats)
         stats.timelines_created += 1
-        log.info(f"   ✅ Timeline ready: {title}")
+        log.info("   ✅ Timeline ready: %s", title)
     except Exception as e:
         stats.log_error(f"Track setup: {title}", str(e))
     if markers:
         try:
-            add_markers_to_timeline_if_empty(tl, FPS, markers)
+            # just created, so nothing to count
+            add_markers_to_timeline_if_empty(tl, FPS, markers, existing=0)
         except Exception as e:
-            log.debug(f"⚠️ Marker add failed for {title}: {e}")
+            log.debug("⚠️ Marker add failed for %s: %s", title, e)
         try:
             strict_snap_master_timeline(tl, _fps_from_str(FPS))
         except Exception as e:
-            log.debug(f"Strict snap defer on {title}: {e}")
+            log.debug("Strict snap defer on %s: %s", title, e)
     return tl
 
 
@@ -3502,22 +3806,18 @@ def create_vertical_timeline_unique(
     mp, project, folder, title, w, h, fps, stats, markers=None
 ):
     # If exists: upgrade labels and seed markers (only if empty)
-    if timeline_exists(project, title):
+    tl = _snapshot_timelines(project).get(title)
+    if tl:
         log.info("    ↺ Timeline exists: %s", title)
-        # get the existing timeline object to upgrade/seed
+        # upgrade/seed the existing timeline object
         try:
-            count = int(project.GetTimelineCount())
-            for i in range(1, count + 1):
-                tl = project.GetTimelineByIndex(i)
-                if tl and tl.GetName() == title:
-                    upgrade_existing_track_labels(tl)
-                    if markers:
-                        add_markers_to_timeline_if_empty(tl, FPS, markers)
-                        try:
-                            strict_snap_master_timeline(tl, _fps_from_str(FPS))
-                        except Exception as e:
-                            log.debug(f"Strict snap defer on {title}: {e}")
-                    break
+            upgrade_existing_track_labels(tl)
+            if markers:
+                add_markers_to_timeline_if_empty(tl, FPS, markers)
+                try:
+                    strict_snap_master_timeline(tl, _fps_from_str(FPS))
+                except Exception as e:
+                    log.debug("Strict snap defer on %s: %s", title, e)
         except Exception:
             pass
         stats.timelines_skipped += 1
@@ -3614,16 +3914,56 @@ PILLARS = {
     },
 }
 
+# pillar -> (lane key, Master Build timeline prefix)
+_PILLAR_LANE_MAP = {
+    "🎵 Music-Video Snippets": ("mv", "MV Master"),
+    "👗 OOTD • Fashion": ("fashion", "Fashion Master"),
+    "🎙️ Talking Head": ("talking", "TH Master"),
+    "☕️ Day in the Life": ("dil", "DIL Master"),
+    "🎹 Cook-Ups": ("cook", "Cook-Up Master"),
+}
+
+
+def _build_formula_plan():
+    """PILLARS flattened to (pillar, subbin, titles, masters) rows in build order.
+
+    Titles carry their format suffix; ``masters`` holds the (name, lane, tier) tiered
+    Master Build timelines for a pillar's "10 | Master Build" subbin, else ().
+    """
+    plan = []
+    for pillar_name, subbins in PILLARS.items():
+        lane_key, base_prefix = _PILLAR_LANE_MAP.get(pillar_name, (None, None))
+        for subbin_name, timeline_names in subbins.items():
+            titles = tuple(
+                base if "— ⏱" in base else f"{base} — ⏱ 29.97p • 📐 2160×3840"
+                for base in timeline_names
+            )
+            masters = ()
+            if lane_key and subbin_name.startswith("10 | Master Build"):
+                masters = tuple(
+                    (f"{base_prefix} — {tier} — 2160×3840 • 29.97p", lane_key, tier)
+                    for tier in ("12s", "22s", "30s")
+                )
+            plan.append((pillar_name, subbin_name, titles, masters))
+    return tuple(plan)
+
+
+_FORMULA_PLAN = _build_formula_plan()
+
+
+# title -> (lane, tier, markers) for the principle timelines main() builds this run;
+# the seeding pass reuses these instead of classifying and enriching each title again.
+_MARKER_PLAN = {}
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+# optional env toggle to force reseed: 1/true/yes/on (read once, fixed for the run)
+_FORCE_RESEED = os.getenv("DEGA_PRINCIPLE_FORCE_RESEED", "").strip().lower() in _TRUTHY
+
 
 def seed_principle_markers_across_project(project, mp):
     """Seed principle markers on all matching non-master timelines with enrichment."""
-    # optional env toggle to force reseed: 1/true/yes/on
-    force_env = os.getenv("DEGA_PRINCIPLE_FORCE_RESEED", "").strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    }
+    force_env = _FORCE_RESEED
     cnt = int(project.GetTimelineCount() or 0)
 
     log.info("🏷️  Seeding principle markers across project...")
@@ -3633,47 +3973,70 @@ def seed_principle_markers_across_project(project, mp):
         if not tl:
             continue
         title = tl.GetName() or ""
-        pack = get_principle_markers_for_title(title)
-        if not pack:  # masters return []
+        planned = _MARKER_PLAN.get(title)
+        if planned:
+            pack = planned[2]
+        else:
+            norm = _norm_title(title)  # normalized once, shared by the classifiers below
+            pack = get_principle_markers_for_title(norm)
+        if not pack:  # masters return ()
             continue
 
-        # Infer lane and enrich markers with cut notes & butt-join borders
-        lane, tier = _lane_tier_from_title(title)
-        if not lane:
-            lane = _infer_lane_from_pillar_or_title("", title)
-        if not tier:
-            tier = (
-                "selects"
-                if ("selects" in title.lower() or "stringouts" in title.lower())
-                else "30s"
-            )
-        enriched = _enrich_marker_notes(pack, lane, tier)
-        markers = _butt_join_markers(enriched, FPS)
-
-        # Set timeline as current for operations
-        project.SetCurrentTimeline(tl)
+        # One GetMarkers probe per timeline; already-seeded timelines are skipped
+        # before any enrichment or SetCurrentTimeline work.
+        existing = _count_markers(tl)
+        if existing > 0 and not force_env:
+            log.info("   ↻ Markers present (%d) — skipping re-seed", existing)
+            continue
 
-        added = add_markers_to_timeline_if_empty(tl, FPS, markers, force=force_env)
+        if planned:
+            # already classified, enriched and butt-joined while building the structure
+            lane, tier, markers = planned
+        else:
+            # Infer lane and enrich markers with cut notes & butt-join borders
+            lane, tier = _lane_tier_from_title(norm)
+            if not lane:
+                lane = _infer_lane_from_pillar_or_title("", norm)
+            if not tier:
+                tier = "selects" if ("selects" in norm or "stringouts" in norm) else "30s"
+            enriched = _enrich_marker_notes(pack, lane, tier)
+            markers = _butt_join_markers(enriched, FPS)
+
+        # Set timeline as current for operations (skipped when it already is)
+        _set_current_timeline(project, tl)
+
+        added = add_markers_to_timeline_if_empty(
+            tl, FPS, markers, force=force_env, existing=existing
+        )
         if added > 0:
             log.info(
-                f"   🏷️ Seeded {added} markers on '{title}' (lane={lane}, tier={tier}, force={force_env})"
+                "   🏷️ Seeded %d markers on '%s' (lane=%s, tier=%s, force=%s)",
+                added,
+                title,
+                lane,
+                tier,
+                force_env,
             )
-        elif added == 0 and _count_markers(tl) == 0:
-            # empty timeline + no markers -> Resolve quirk: use silent-clip fallback
+        elif added == 0 and existing == 0:
+            # empty timeline + no markers -> Resolve quirk: use silent-clip fallback.
+            # An unknown count (-1) may mean markers already block these frames.
             try:
-                log.info(f"   🔧 Adding silent clip to enable markers on: {title}")
+                log.info("   🔧 Adding silent clip to enable markers on: %s", title)
                 if ensure_timeline_nonempty_with_silence(mp, project, tl, seconds=2.0):
                     added = add_markers_to_timeline_if_empty(
                         tl, FPS, markers, force=True
                     )
                     if added > 0:
-                        log.info(f"   ✅ Fallback seeded {added} markers on: {title}")
+                        log.info("   ✅ Fallback seeded %d markers on: %s", added, title)
             except Exception as e:
-                log.warning(f"   ⚠️  Fallback failed on '{title}': {e}")
+                log.warning("   ⚠️  Fallback failed on '%s': %s", title, e)
 
 
 def main():
+    setup_logger()
     stats = BuildStats()
+    _TIMELINE_SNAPSHOTS.clear()  # timelines may have changed since a previous run
+    _MARKER_PLAN.clear()
 
     # v4.7.1: Enable transparent enrichment via monkey-patching
     log.info(SECONDS_PACING_DOC)
@@ -3690,9 +4053,9 @@ def main():
         return False
 
     project_name = proj.GetName()
-    log.info(f"🎯 Project: {project_name}")
-    log.info(f"📐 Format: {WIDTH}×{HEIGHT} @ {FPS}fps")
-    log.info(f"📊 Structure: {len(TOP_BINS)} top bins, {len(PILLARS)} pillars")
+    log.info("🎯 Project: %s", project_name)
+    log.info("📐 Format: %s×%s @ %sfps", WIDTH, HEIGHT, FPS)
+    log.info("📊 Structure: %d top bins, %d pillars", len(TOP_BINS), len(PILLARS))
 
     mp = proj.GetMediaPool()
     root = mp.GetRootFolder()
@@ -3700,93 +4063,86 @@ def main():
         log.error("❌ MediaPool root missing")
         return False
 
-    # Top bins
-    log.info("📂 Creating top-level bins…")
-    top = {}
-    for name in TOP_BINS:
-        top[name] = get_or_create_folder(mp, root, name, stats)
-
-    # Money timelines (legacy + tiered)
-    money_folder = top.get("01 | 💰 The Money")
-
-    # Legacy references
-    create_vertical_timeline_unique(
-        mp,
-        proj,
-        money_folder,
-        "01 | 💰 The Money — ⏱ 29.97p • ⌁ 709/2.4 • 📐 2160×3840 • 🎚 v01",
-        WIDTH,
-        HEIGHT,
-        FPS,
-        stats,
-    )
-    create_vertical_timeline_unique(
-        mp,
-        proj,
-        money_folder,
-        "01 | 💰 The Money (Render-Only Nest) — QC • burn-ins",
-        WIDTH,
-        HEIGHT,
-        FPS,
-        stats,
-    )
+    # Timeline creation switches the project to the build format; restored once below
+    try:
+        # Top bins
+        log.info("📂 Creating top-level bins…")
+        top = {}
+        for name in TOP_BINS:
+            top[name] = get_or_create_folder(mp, root, name, stats)
+
+        # Money timelines (legacy + tiered)
+        money_folder = top.get("01 | 💰 The Money")
 
-    # Money Masters with markers (enriched with cut notes & tight borders)
-    for _name, _tier in [
-        ("Money Master — 12s (IG short) — 2160×3840 • 29.97p", "12s"),
-        ("Money Master — 22s (IG mid) — 2160×3840 • 29.97p", "22s"),
-        ("Money Master — 30s (IG upper) — 2160×3840 • 29.97p", "30s"),
-    ]:
-        _raw = LANE_MARKERS["money"][_tier]
-        enriched = _enrich_marker_notes(_raw, "money", _tier)
-        _paced = _butt_join_markers(enriched, FPS)
+        # Legacy references
+        create_vertical_timeline_unique(
+            mp,
+            proj,
+            money_folder,
+            "01 | 💰 The Money — ⏱ 29.97p • ⌁ 709/2.4 • 📐 2160×3840 • 🎚 v01",
+            WIDTH,
+            HEIGHT,
+            FPS,
+            stats,
+        )
         create_vertical_timeline_unique(
-            mp, proj, money_folder, _name, WIDTH, HEIGHT, FPS, stats, markers=_paced
+            mp,
+            proj,
+            money_folder,
+            "01 | 💰 The Money (Render-Only Nest) — QC • burn-ins",
+            WIDTH,
+            HEIGHT,
+            FPS,
+            stats,
         )
 
-    # Formula lanes
-    log.info("🧪 Creating Formula pillar structure…")
-    formula_root = top.get("02 | 🧪 The Formula")
+        # Money Masters with markers (enriched with cut notes & tight borders)
+        for _name, _tier in [
+            ("Money Master — 12s (IG short) — 2160×3840 • 29.97p", "12s"),
+            ("Money Master — 22s (IG mid) — 2160×3840 • 29.97p", "22s"),
+            ("Money Master — 30s (IG upper) — 2160×3840 • 29.97p", "30s"),
+        ]:
+            _raw = _lane_markers_flat()[("money", _tier)]
+            enriched = _enrich_marker_notes(_raw, "money", _tier)
+            _paced = _butt_join_markers(enriched, FPS)
+            create_vertical_timeline_unique(
+                mp, proj, money_folder, _name, WIDTH, HEIGHT, FPS, stats, markers=_paced
+            )
 
-    # Utility: master build tiered names per lane
-    def _tier_names(prefix):
-        return [
-            f"{prefix} — 12s — 2160×3840 • 29.97p",
-            f"{prefix} — 22s — 2160×3840 • 29.97p",
-            f"{prefix} — 30s — 2160×3840 • 29.97p",
-        ]
+        # Formula lanes
+        log.info("🧪 Creating Formula pillar structure…")
+        formula_root = top.get("02 | 🧪 The Formula")
 
-    for pillar_name, subbins in PILLARS.items():
-        log.info(f"🎯 Pillar: {pillar_name}")
-        pillar_folder = get_or_create_folder(mp, formula_root, pillar_name, stats)
+        pillar_folder = current_pillar = None
+        for pillar_name, subbin_name, titles, masters in _FORMULA_PLAN:
+            if pillar_name != current_pillar:
+                current_pillar = pillar_name
+                log.info("🎯 Pillar: %s", pillar_name)
+                pillar_folder = get_or_create_folder(mp, formula_root, pillar_name, stats)
 
-        for subbin_name, timeline_names in subbins.items():
-            log.info(f"  📂 {subbin_name}")
+            log.info("  📂 %s", subbin_name)
             sub_folder = get_or_create_folder(mp, pillar_folder, subbin_name, stats)
 
             # seed standard timelines (principle/selects/segments/shotfx etc.)
-            for base in timeline_names:
-                title = base if "— ⏱" in base else f"{base} — ⏱ 29.97p • 📐 2160×3840"
-                lane_guess = _infer_lane_from_pillar_or_title(pillar_name, title)
+            for title in titles:
+                norm = _norm_title(title)
 
                 # Pull the appropriate principle pack (if any), then enrich & tighten
-                _pm = get_principle_markers_for_title(title)
+                _pm = get_principle_markers_for_title(norm)
                 if _pm:
                     # Use v4.7 lane/tier system
-                    lane, tier = _lane_tier_from_title(title)
+                    lane, tier = _lane_tier_from_title(norm)
                     if not lane:
-                        lane = lane_guess
+                        lane = _infer_lane_from_pillar_or_title(pillar_name, norm)
                     if not tier:
                         tier = (
                             "selects"
-                            if (
-                                "selects" in title.lower()
-                                or "stringouts" in title.lower()
-                            )
+                            if ("selects" in norm or "stringouts" in norm)
                             else "30s"
                         )
                     enriched = _enrich_marker_notes(_pm, lane, tier)
                     _pm = _butt_join_markers(enriched, FPS)
+                    _MARKER_PLAN[title] = (lane, tier, _pm)
                     log.debug(
                         "   🏷️  Timeline: %s → %d markers (lane=%s, tier=%s)",
                         title,
@@ -3808,60 +4164,23 @@ def main():
                 )
 
             # add tiered Master Build timelines with lane-specific markers
-            if subbin_name.startswith("10 | Master Build"):
-                lane_key = (
-                    "mv"
-                    if "Music-Video" in pillar_name
-                    else (
-                        "fashion"
-                        if "Fashion" in pillar_name
-                        else (
-                            "talking"
-                            if "Talking Head" in pillar_name
-                            else (
-                                "dil"
-                                if "Day in the Life" in pillar_name
-                                else "cook" if "Cook-Ups" in pillar_name else None
-                            )
-                        )
-                    )
+            for name, lane_key, tier in masters:
+                raw = _lane_markers_flat()[(lane_key, tier)]
+                enriched = _enrich_marker_notes(raw, lane_key, tier)
+                paced = _butt_join_markers(enriched, FPS)
+                create_vertical_timeline_unique(
+                    mp,
+                    proj,
+                    sub_folder,
+                    name,
+                    WIDTH,
+                    HEIGHT,
+                    FPS,
+                    stats,
+                    markers=paced,
                 )
-                if lane_key:
-                    base_prefix = (
-                        "MV Master"
-                        if lane_key == "mv"
-                        else (
-                            "Fashion Master"
-                            if lane_key == "fashion"
-                            else (
-                                "TH Master"
-                                if lane_key == "talking"
-                                else (
-                                    "DIL Master"
-                                    if lane_key == "dil"
-                                    else "Cook-Up Master"
-                                )
-                            )
-                        )
-                    )
-                    names = _tier_names(base_prefix)
-                    # Map to marker sets with enrichment & tightening
-                    tier_keys = ["12s", "22s", "30s"]
-                    for name, tier in zip(names, tier_keys, strict=False):
-                        raw = LANE_MARKERS[lane_key][tier]
-                        enriched = _enrich_marker_notes(raw, lane_key, tier)
-                        paced = _butt_join_markers(enriched, FPS)
-                        create_vertical_timeline_unique(
-                            mp,
-                            proj,
-                            sub_folder,
-                            name,
-                            WIDTH,
-                            HEIGHT,
-                            FPS,
-                            stats,
-                            markers=paced,
-                        )
+    finally:
+        _release_project_defaults()
 
     # Seed principle markers across all matching timelines
     seed_principle_markers_across_project(proj, mp)
@@ -3908,7 +4227,7 @@ def main():
         enforce_terminal_loop_cta_exact(proj, FPS)
         log.info("🔒 Terminal LOOP/CTA enforced on all masters (exact-second).")
     except Exception as e:
-        log.warning(f"Terminal LOOP/CTA pass skipped: {e}")
+        log.warning("Terminal LOOP/CTA pass skipped: %s", e)
 
     try:
         proj.Save() if hasattr(proj, "Save") else None
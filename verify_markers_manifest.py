@@ -6,72 +6,111 @@ that the scripting API is available.
 """
 
 import argparse
-import collections
 import json
 import pathlib
+import re
 import sys
 from collections import defaultdict
 from datetime import UTC, datetime
 from fractions import Fraction
+from functools import lru_cache
+
+try:  # optional: C JSON parse/encode for large manifests; stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_TIERS = {"12s", "22s", "30s"}
+_BASE_TIER_KEYS = tuple(sorted(BASE_TIERS))  # counted tiers come from _infer_tier only
 _TERMINAL_TIER_SECONDS = {12.0: 12.0, 22.0: 22.0, 30.0: 30.0}
 
 
-def _tier_spec_from_title(title: str) -> float | None:
-    text = (title or "").lower()
-    if "— 12s" in text or " 12s " in text or text.endswith(" 12s") or " 12s —" in text:
-        return 12.0
-    if "— 22s" in text or " 22s " in text or text.endswith(" 22s") or " 22s —" in text:
-        return 22.0
-    if "— 30s" in text or " 30s " in text or text.endswith(" 30s") or " 30s —" in text:
-        return 30.0
+# A spaced tier token: "— Ns" anywhere, or " Ns" followed by a space or the end. One
+# left-to-right scan collects them; the lowest tier wins, as in the old 12/22/30 order.
+_TIER_DIGIT_RE = re.compile(r"— (12|22|30)s| (12|22|30)s(?= |\Z)")
+_MASTER_PREFIXES = (
+    "money master",
+    "mv master",
+    "th master",
+    "fashion master",
+    "dil master",
+    "cook-up master",
+)
+# Fallbacks when the title carries no spaced tier, checked in order: "Ns" next to a
+# 29.97 rate, then the legacy "(IG short|mid|upper)" labels.
+_RATE_TIER_HINTS = (("12s", 12.0), ("22s", 22.0), ("30s", 30.0))
+_IG_TIER_HINTS = (("(ig short", 12.0), ("(ig mid", 22.0), ("(ig upper", 30.0))
+
+
+# The cached helpers take an already-lowercased title so a caller holding one lowers it
+# once; the *_from_title / *_title wrappers accept raw titles.
+@lru_cache(maxsize=4096)
+def _tier_spec(lowered: str) -> float | None:
+    best = None
+    for match in _TIER_DIGIT_RE.finditer(lowered):
+        tier = int(match.group(1) or match.group(2))
+        if tier == 12:
+            return 12.0  # highest priority; nothing later can beat it
+        if best is None or tier < best:
+            best = tier
+    return float(best) if best is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _is_master(lowered: str) -> bool:
+    # one C-level startswith over every lane prefix
+    return lowered.startswith(_MASTER_PREFIXES) or " master —" in lowered
+
+
+@lru_cache(maxsize=4096)
+def _tier_seconds(lowered: str) -> float | None:
+    tier = _tier_spec(lowered)
+    if tier in _TERMINAL_TIER_SECONDS:
+        return tier
+    hints = (_RATE_TIER_HINTS + _IG_TIER_HINTS) if "29.97" in lowered else _IG_TIER_HINTS
+    for needle, seconds in hints:
+        if needle in lowered:
+            return seconds
     return None
 
 
+def _tier_spec_from_title(title: str) -> float | None:
+    return _tier_spec((title or "").lower())
+
+
 def _is_master_title(title: str) -> bool:
-    lowered = (title or "").lower()
-    return (
-        lowered.startswith("money master")
-        or lowered.startswith("mv master")
-        or lowered.startswith("th master")
-        or lowered.startswith("fashion master")
-        or lowered.startswith("dil master")
-        or lowered.startswith("cook-up master")
-        or (" master —" in lowered)
-    )
+    return _is_master((title or "").lower())
 
 
 def _tier_seconds_from_title(title: str) -> float | None:
-    tier = _tier_spec_from_title(title)
-    if tier in _TERMINAL_TIER_SECONDS:
-        return tier
-    text = (title or "").lower()
-    if "12s" in text and "29.97" in text:
-        return 12.0
-    if "22s" in text and "29.97" in text:
-        return 22.0
-    if "30s" in text and "29.97" in text:
-        return 30.0
-    if "(ig short" in text:
-        return 12.0
-    if "(ig mid" in text:
-        return 22.0
-    if "(ig upper" in text:
-        return 30.0
-    return None
+    return _tier_seconds((title or "").lower())
 
 
+@lru_cache(maxsize=256)
 def _sec_to_frame_exact(sec: float, fps: float) -> int:
+    # few distinct (tier, fps) pairs per project: parse and reduce each pair once
     try:
         return int(round(float(Fraction(str(sec)) * Fraction(str(fps)))))
     except Exception:
         return int(round(sec * fps))
 
 
-def _remarkers_dict(timeline) -> dict[int, dict]:
+def _timeline_markers(timeline, markers_cache: dict[int, object] | None = None):
+    """Raw GetMarkers() payload, fetched once per timeline per verification."""
+    key = id(timeline)
+    if markers_cache is not None and key in markers_cache:
+        return markers_cache[key]
+    raw = timeline.GetMarkers()
+    if markers_cache is not None:
+        markers_cache[key] = raw
+    return raw
+
+
+def _remarkers_dict(
+    timeline, markers_cache: dict[int, object] | None = None
+) -> dict[int, dict]:
     try:
-        raw = timeline.GetMarkers()
+        raw = _timeline_markers(timeline, markers_cache)
     except Exception:
         return {}
     if isinstance(raw, dict):
@@ -122,13 +161,13 @@ def _frame_is_covered(markers: dict[int, dict], target_frame: int) -> bool:
     return _find_covering_marker(markers, target_frame) is not None
 
 
-def _inspect_terminal_loop_lock(project, fallback_fps: float | None):
-    unlocked: list[str] = []
+def _project_timelines(project) -> list[tuple[str, object]]:
+    """(title, timeline) for every timeline, fetched from Resolve once per verification."""
     try:
         timeline_total = int(project.GetTimelineCount() or 0)
     except Exception:
         timeline_total = 0
-
+    timelines: list[tuple[str, object]] = []
     for index in range(1, timeline_total + 1):
         timeline = project.GetTimelineByIndex(index)
         if not timeline:
@@ -137,16 +176,28 @@ def _inspect_terminal_loop_lock(project, fallback_fps: float | None):
             title = timeline.GetName() or ""
         except Exception:
             title = ""
-        if not title or not _is_master_title(title):
+        timelines.append((title, timeline))
+    return timelines
+
+
+def _inspect_terminal_loop_lock(
+    timelines: list[tuple[str, object]],
+    fallback_fps: float | None,
+    markers_cache: dict[int, object] | None = None,
+):
+    unlocked: list[str] = []
+    for title, timeline in timelines:
+        lowered = title.lower()
+        if not lowered or not _is_master(lowered):
             continue
-        tier_seconds = _tier_seconds_from_title(title)
+        tier_seconds = _tier_seconds(lowered)
         if tier_seconds is None:
             continue
         fps_value = timeline.GetSetting("timelineFrameRate")
         fps = _as_float(fps_value) or fallback_fps
         if not fps or fps <= 0:
             continue
-        markers = _remarkers_dict(timeline)
+        markers = _remarkers_dict(timeline, markers_cache)
         if not markers:
             unlocked.append(title)
             continue
@@ -160,30 +211,6 @@ def _inspect_terminal_loop_lock(project, fallback_fps: float | None):
     }
 
 
-def _resolve_timecode(timeline, frame_id: int) -> str:
-    getter = getattr(timeline, "GetTimecodeFromFrame", None)
-    if callable(getter):
-        try:
-            value = getter(frame_id)
-            if value:
-                return value
-        except Exception:
-            pass
-    fps = timeline.GetSetting("timelineFrameRate")
-    try:
-        fps_value = float(fps)
-    except (TypeError, ValueError):
-        fps_value = 0.0
-    if fps_value <= 0:
-        return str(frame_id)
-    total_seconds = frame_id / fps_value
-    hours = int(total_seconds // 3600)
-    minutes = int((total_seconds % 3600) // 60)
-    seconds = int(total_seconds % 60)
-    frames = int(round((total_seconds - int(total_seconds)) * fps_value))
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
-
-
 def get_resolve():
     """Acquire the Resolve scripting API handle."""
     bmd = globals().get("bmd")
@@ -206,6 +233,7 @@ def get_resolve():
     sys.exit(1)
 
 
+@lru_cache(maxsize=4096)
 def _infer_tier(name: str) -> str | None:
     lowered = name.lower()
     for label in BASE_TIERS:
@@ -214,6 +242,12 @@ def _infer_tier(name: str) -> str | None:
     return None
 
 
+def _clear_title_caches() -> None:
+    """Bound the title caches across runs inside a long-lived Resolve session."""
+    for helper in (_tier_spec, _is_master, _tier_seconds, _infer_tier):
+        helper.cache_clear()
+
+
 def _as_float(value) -> float | None:
     try:
         coerced = float(value)
@@ -265,18 +299,21 @@ def _load_manifest(path: pathlib.Path) -> dict:
     if not path.is_file():
         print(f"❌ Manifest not found: {path}")
         sys.exit(1)
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
-def _prepare_actual_markers(timeline) -> dict[int, list[dict]]:
-    marker_map = timeline.GetMarkers() or {}
+def _prepare_actual_markers(
+    timeline, markers_cache: dict[int, object] | None = None
+) -> dict[int, list[dict]]:
+    marker_map = _timeline_markers(timeline, markers_cache) or {}
     prepared: dict[int, list[dict]] = defaultdict(list)
     for frame_id, payload in marker_map.items():
         prepared[int(frame_id)].append(
             {
                 "frame_id": int(frame_id),
-                "timecode": _resolve_timecode(timeline, int(frame_id)),
                 "name": payload.get("name"),
                 "note": payload.get("note"),
                 "color": payload.get("color"),
@@ -285,23 +322,28 @@ def _prepare_actual_markers(timeline) -> dict[int, list[dict]]:
                 "flags": payload.get("flags"),
             }
         )
-    for markers in prepared.values():
-        markers.sort(key=lambda item: item["frame_id"])
+    # GetMarkers() is keyed by frame, so every bucket holds one marker already in order
     return prepared
 
 
+@lru_cache(maxsize=32)
+def _match_offsets(tolerance: int) -> tuple[int, ...]:
+    """Non-zero frame offsets to probe, nearest first: -1, +1, -2, +2, ..."""
+    offsets: list[int] = []
+    for delta in range(1, tolerance + 1):
+        offsets += (-delta, delta)
+    return tuple(offsets)
+
+
 def _pop_match(
     actual_index: dict[int, list[dict]], expected_frame: int, tolerance: int
 ):
-    candidates = []
-    for delta in range(tolerance + 1):
-        if delta == 0:
-            candidates.append(expected_frame)
-        else:
-            candidates.extend([expected_frame - delta, expected_frame + delta])
-    for frame in candidates:
-        if frame in actual_index and actual_index[frame]:
-            return actual_index[frame].pop(0)
+    # exact frame is the common case: one dict probe, no offsets
+    if bucket := actual_index.get(expected_frame):
+        return bucket.pop(0)
+    for offset in _match_offsets(tolerance):
+        if bucket := actual_index.get(expected_frame + offset):
+            return bucket.pop(0)
     return None
 
 
@@ -362,6 +404,7 @@ def verify_manifest(
     *,
     quiet: bool = False,
 ) -> dict:
+    _clear_title_caches()
     manifest = _load_manifest(manifest_path)
     resolve = get_resolve()
     project_manager = resolve.GetProjectManager()
@@ -373,29 +416,25 @@ def verify_manifest(
         sys.exit(1)
 
     manifest_timelines = manifest.get("timelines", [])
-    manifest_tier_counts = collections.Counter()
+    manifest_tier_counts = dict.fromkeys(BASE_TIERS, 0)
     expected_markers_total = 0
-    for entry in manifest_timelines:
-        tier = _infer_tier(entry.get("name") or "")
-        marker_count = len(entry.get("markers", []))
-        expected_markers_total += marker_count
-        if tier:
-            manifest_tier_counts[tier] += marker_count
     details: list[dict] = []
     errors_total = 0
     warnings_total = 0
 
-    lookup = {
-        tl.GetName(): tl
-        for tl in (
-            project.GetTimelineByIndex(i)
-            for i in range(1, (project.GetTimelineCount() or 0) + 1)
-        )
-        if tl
-    }
+    timelines = _project_timelines(project)
+    lookup = dict(timelines)
+    # per-timeline markers, shared by the comparison and loop-lock passes
+    markers_cache: dict[int, object] = {}
 
     for timeline_entry in manifest_timelines:
         name = timeline_entry.get("name")
+        expected_markers = timeline_entry.get("markers", [])
+        # manifest tallies ride along with the comparison pass
+        expected_markers_total += len(expected_markers)
+        tier = _infer_tier(name or "")
+        if tier:
+            manifest_tier_counts[tier] += len(expected_markers)
         timeline = lookup.get(name)
         if not timeline:
             detail = {
@@ -407,8 +446,7 @@ def verify_manifest(
             details.append(detail)
             errors_total += 1
             continue
-        expected_markers = timeline_entry.get("markers", [])
-        actual_index = _prepare_actual_markers(timeline)
+        actual_index = _prepare_actual_markers(timeline, markers_cache)
         detail = _compare_markers(name, expected_markers, actual_index, frame_tolerance)
         details.append(detail)
         errors_total += len(detail["errors"])
@@ -420,7 +458,10 @@ def verify_manifest(
     project_fps = _as_float(project_fps_value)
     drop_frame = _detect_drop_frame(project, manifest_timelines)
     declared_tier_counts = manifest.get("tier_counts") or {}
-    loop_lock = _inspect_terminal_loop_lock(project, project_fps)
+    declared_tier_keys = sorted(BASE_TIERS | declared_tier_counts.keys())
+    loop_lock = _inspect_terminal_loop_lock(
+        timelines, project_fps, markers_cache
+    )
 
     summary = {
         "project": {
@@ -446,12 +487,10 @@ def verify_manifest(
             "markers_total_declared": manifest.get("markers_total"),
             "markers_total_counted": expected_markers_total,
             "tier_counts_declared": {
-                key: declared_tier_counts.get(key, 0)
-                for key in sorted(BASE_TIERS | set(declared_tier_counts.keys()))
+                key: declared_tier_counts.get(key, 0) for key in declared_tier_keys
             },
             "tier_counts_counted": {
-                key: manifest_tier_counts.get(key, 0)
-                for key in sorted(BASE_TIERS | set(manifest_tier_counts.keys()))
+                key: manifest_tier_counts.get(key, 0) for key in _BASE_TIER_KEYS
             },
         },
     }
@@ -466,9 +505,15 @@ def verify_manifest(
     report["generated_at_utc"] = timestamp
 
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    with report_path.open("w", encoding="utf-8") as handle:
-        json.dump(report, handle, indent=2)
-        handle.write("\n")
+    if orjson is not None:
+        # C encoder, one write; same bytes as the json.dump path below (UTF-8, 2-space indent)
+        report_path.write_bytes(
+            orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+    else:
+        with report_path.open("w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
+            handle.write("\n")
 
     if not quiet:
         print("🧪 Markers manifest verification")